@@ -49,6 +49,7 @@ from claude_task_master.core.config import (
     generate_default_config_dict,
     generate_default_config_json,
     get_model_name,
+    load_config_json,
 )
 from claude_task_master.core.config_loader import (
     CONFIG,
@@ -160,6 +161,7 @@ __all__ = [
     "generate_default_config_json",
     "get_model_name",
     "get_tools_for_phase",
+    "load_config_json",
     # Config loader classes and functions
     "ConfigManager",
     "CONFIG",
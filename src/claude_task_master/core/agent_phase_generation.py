@@ -8,10 +8,10 @@ Provides :class:`_AgentPhaseGenerationMixin` with:
 
 from __future__ import annotations
 
+from collections.abc import Coroutine
 from typing import TYPE_CHECKING, Any
 
 from . import console
-from .agent_async_utils import run_async_with_cleanup
 from .agent_models import ModelType
 from .prompts import (
     build_coding_style_prompt,
@@ -39,6 +39,10 @@ class _AgentPhaseGenerationMixin:
         """Return tool list for *phase* — overridden by AgentPhaseExecutor."""
         raise NotImplementedError  # pragma: no cover
 
+    def _run_async(self, coro: Coroutine[Any, Any, str]) -> str:
+        """Run *coro* to completion — overridden by AgentPhaseExecutor."""
+        raise NotImplementedError  # pragma: no cover
+
     def generate_coding_style(self) -> dict[str, Any]:
         """Generate a coding style guide by analyzing the codebase.
 
@@ -54,7 +58,7 @@ class _AgentPhaseGenerationMixin:
         console.info("Generating coding style guide with Opus...")
 
         # Run with planning tools (read-only) and Opus for quality
-        result = run_async_with_cleanup(
+        result = self._run_async(
             self.query_executor.run_query(
                 prompt=prompt,
                 tools=self.get_tools_for_phase("planning"),
@@ -90,7 +94,7 @@ class _AgentPhaseGenerationMixin:
         console.info("Discovering release infrastructure with Sonnet...")
 
         # Use working tools (all tools including Bash) so agent can probe env/CLIs
-        result = run_async_with_cleanup(
+        result = self._run_async(
             self.query_executor.run_query(
                 prompt=prompt,
                 tools=self.get_tools_for_phase("working"),  # All tools for probing
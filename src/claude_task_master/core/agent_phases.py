@@ -12,6 +12,7 @@ Code-style / release-guide generation lives in :mod:`.agent_phase_generation`.
 
 from __future__ import annotations
 
+from collections.abc import Coroutine
 from typing import TYPE_CHECKING, Any
 
 from . import console
@@ -53,6 +54,7 @@ class AgentPhaseExecutor(_AgentPhaseGenerationMixin):
         get_agents_func: Any = None,
         process_message_func: Any = None,
         message_processor: MessageProcessor | None = None,
+        run_async_func: Any = None,
     ):
         """Initialize the phase executor.
 
@@ -67,6 +69,9 @@ class AgentPhaseExecutor(_AgentPhaseGenerationMixin):
                 passed as ``process_message_func``. Held so ``run_work_session``
                 can derive session success from the captured terminal
                 ResultMessage. Optional for backward compatibility.
+            run_async_func: Function that drives a query coroutine to completion
+                from sync code. Defaults to ``run_async_with_cleanup``; tests
+                inject a stub here instead of patching the module.
         """
         self.query_executor = query_executor
         self.model = model
@@ -75,6 +80,14 @@ class AgentPhaseExecutor(_AgentPhaseGenerationMixin):
         self.get_agents_func = get_agents_func
         self.process_message_func = process_message_func
         self.message_processor = message_processor
+        self.run_async_func = run_async_func
+
+    def _run_async(self, coro: Coroutine[Any, Any, str]) -> str:
+        """Run a query coroutine to completion with the configured runner."""
+        # Resolve the default at call time so patching the module still works.
+        runner = self.run_async_func or run_async_with_cleanup
+        result: str = runner(coro)
+        return result
 
     def run_planning_phase(
         self,
@@ -123,7 +136,7 @@ class AgentPhaseExecutor(_AgentPhaseGenerationMixin):
         console.info("Planning with Opus (smartest model)...")
 
         # Run async query with Opus override
-        result = run_async_with_cleanup(
+        result = self._run_async(
             self.query_executor.run_query(
                 prompt=prompt,
                 tools=self.get_tools_for_phase("planning"),
@@ -204,7 +217,7 @@ class AgentPhaseExecutor(_AgentPhaseGenerationMixin):
             self.message_processor.reset_result_state()
 
         # Run async query with optional model override
-        result = run_async_with_cleanup(
+        result = self._run_async(
             self.query_executor.run_query(
                 prompt=prompt,
                 tools=self.get_tools_for_phase("working"),
@@ -269,7 +282,7 @@ class AgentPhaseExecutor(_AgentPhaseGenerationMixin):
 
         # Run the prompt directly with verification tools (read + bash for
         # gh/curl/migration checks) — no create-PR wrapper, no write tools.
-        result = run_async_with_cleanup(
+        result = self._run_async(
             self.query_executor.run_query(
                 prompt=prompt,
                 tools=self.get_tools_for_phase("verification"),
@@ -323,7 +336,7 @@ class AgentPhaseExecutor(_AgentPhaseGenerationMixin):
         )
 
         # Run async query with verification tools (read + bash for running tests)
-        result = run_async_with_cleanup(
+        result = self._run_async(
             self.query_executor.run_query(
                 prompt=prompt,
                 tools=self.get_tools_for_phase("verification"),
@@ -369,7 +382,7 @@ class AgentPhaseExecutor(_AgentPhaseGenerationMixin):
 
         # Read-only tools (planning phase) — extraction only summarizes text
         # already in the prompt; it must never modify the repo or run commands.
-        result = run_async_with_cleanup(
+        result = self._run_async(
             self.query_executor.run_query(
                 prompt=prompt,
                 tools=self.get_tools_for_phase("planning"),
@@ -31,17 +31,30 @@ file-based config. See ``config_loader_io.apply_env_overrides``.
 
 from __future__ import annotations
 
+import functools
 import json
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 # =============================================================================
 # Configuration Sub-Models
 # =============================================================================
 
 
-class APIConfig(BaseModel):
+class _ConfigModel(BaseModel):
+    """Base for the config models: read-only once validated.
+
+    Config is built once (file + env overrides, which go through a dict and
+    re-validate), then only read, so instances are frozen and can be shared.
+    Validators are built on first use rather than at import, so commands that
+    never read the config (``--help``, ``version``) don't pay for them.
+    """
+
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+
+class APIConfig(_ConfigModel):
     """API configuration settings.
 
     Supports both Anthropic direct API and OpenRouter proxy.
@@ -66,7 +79,7 @@ class APIConfig(BaseModel):
     )
 
 
-class ModelConfig(BaseModel):
+class ModelConfig(_ConfigModel):
     """Model name mappings.
 
     Maps friendly names (sonnet, opus, haiku) to full API model strings.
@@ -99,7 +112,7 @@ class ModelConfig(BaseModel):
     )
 
 
-class GitConfig(BaseModel):
+class GitConfig(_ConfigModel):
     """Git configuration settings.
 
     Controls how claudetm interacts with git for PRs and branches.
@@ -116,7 +129,7 @@ class GitConfig(BaseModel):
     )
 
 
-class ContextWindowsConfig(BaseModel):
+class ContextWindowsConfig(_ConfigModel):
     """Context window sizes per model (in tokens).
 
     Controls the max context window size used for auto-compact threshold calculation.
@@ -163,29 +176,36 @@ class ContextWindowsConfig(BaseModel):
     )
 
 
-class ToolsConfig(BaseModel):
+# Default per-phase tool sets. Tuples are immutable, so every ToolsConfig can
+# share these instead of allocating fresh lists.
+_DEFAULT_PLANNING_TOOLS = ("Read", "Glob", "Grep", "WebFetch", "WebSearch")
+_DEFAULT_VERIFICATION_TOOLS = ("Read", "Glob", "Grep", "Bash")
+
+
+class ToolsConfig(_ConfigModel):
     """Tool configurations per execution phase.
 
-    Each phase has a list of allowed tools. Planning and verification default
-    to read-only tool sets so the agent cannot mutate the repository before a
-    plan exists or while checking success criteria — matching the phase table
-    in CLAUDE.md. The working phase defaults to an empty list, which means ALL
-    tools are allowed (full access to implement tasks).
+    Each phase has a tuple of allowed tools (JSON config files use plain
+    lists). Planning and verification default to read-only tool sets so the
+    agent cannot mutate the repository before a plan exists or while checking
+    success criteria — matching the phase table in CLAUDE.md. The working
+    phase defaults to an empty tuple (JSON ``[]``), which means ALL tools are
+    allowed (full access to implement tasks).
 
-    An empty list always means ALL tools are allowed for that phase.
+    An empty tuple (JSON ``[]``) always means ALL tools are allowed for that phase.
     """
 
-    planning: list[str] = Field(
-        default_factory=lambda: ["Read", "Glob", "Grep", "WebFetch", "WebSearch"],
+    planning: tuple[str, ...] = Field(
+        default=_DEFAULT_PLANNING_TOOLS,
         description="Tools available during planning phase (read-only default; empty = all tools).",
     )
-    verification: list[str] = Field(
-        default_factory=lambda: ["Read", "Glob", "Grep", "Bash"],
+    verification: tuple[str, ...] = Field(
+        default=_DEFAULT_VERIFICATION_TOOLS,
         description="Tools available during verification phase "
         "(read + Bash default; empty = all tools).",
     )
-    working: list[str] = Field(
-        default_factory=list,
+    working: tuple[str, ...] = Field(
+        default=(),
         description="Tools available during working phase (empty = all tools allowed).",
     )
 
@@ -195,7 +215,7 @@ class ToolsConfig(BaseModel):
 # =============================================================================
 
 
-class ClaudeTaskMasterConfig(BaseModel):
+class ClaudeTaskMasterConfig(_ConfigModel):
     """Main configuration model for Claude Task Master.
 
     This is the root configuration object that contains all settings.
@@ -280,18 +300,25 @@ def generate_default_config() -> ClaudeTaskMasterConfig:
 def generate_default_config_dict() -> dict[str, Any]:
     """Generate default configuration as a dictionary.
 
-    This is useful for writing to JSON files or for serialization.
+    This is useful for writing to JSON files or for serialization, so it is
+    dumped in JSON mode (tool tuples come back as lists).
 
     Returns:
         Dictionary representation of the default configuration.
     """
     config = generate_default_config()
-    return config.model_dump()
+    return config.model_dump(mode="json")
 
 
+@functools.cache
 def generate_default_config_json(indent: int = 2) -> str:
     """Generate default configuration as a formatted JSON string.
 
+    The defaults are fixed and a ``str`` is immutable, so the rendering is
+    cached per ``indent``. The model and dict variants above stay uncached:
+    each caller gets a fresh, mutable object, and validating a new model is
+    cheaper than deep-copying a cached one.
+
     Args:
         indent: Number of spaces for JSON indentation.
 
@@ -301,10 +328,45 @@ def generate_default_config_json(indent: int = 2) -> str:
     return json.dumps(generate_default_config_dict(), indent=indent)
 
 
+# =============================================================================
+# Parsing
+# =============================================================================
+
+
+def load_config_json(text: str | bytes) -> ClaudeTaskMasterConfig:
+    """Parse and validate a JSON config document in a single pass.
+
+    pydantic-core parses the JSON itself, so no intermediate ``dict`` is built
+    and walked a second time as with ``model_validate(json.loads(text))``.
+    Malformed JSON still surfaces as ``json.JSONDecodeError``: only on that
+    error path is the text re-parsed with the stdlib to get its error.
+
+    Args:
+        text: JSON document, as read from ``config.json``.
+
+    Returns:
+        ClaudeTaskMasterConfig object.
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON.
+        ValidationError: If the JSON doesn't match the schema.
+    """
+    try:
+        return ClaudeTaskMasterConfig.model_validate_json(text)
+    except ValidationError as e:
+        if any(err["type"] == "json_invalid" for err in e.errors()):
+            json.loads(text)
+        raise
+
+
 # =============================================================================
 # Utility Functions
 # =============================================================================
 
+# Lookup keys are the field names, so new models or phases are picked up as added.
+_MODEL_KEYS = frozenset(ModelConfig.model_fields)
+_PHASE_KEYS = frozenset(ToolsConfig.model_fields)
+
 
 def get_model_name(config: ClaudeTaskMasterConfig, model_key: str) -> str:
     """Get the full model name from a model key.
@@ -317,17 +379,11 @@ def get_model_name(config: ClaudeTaskMasterConfig, model_key: str) -> str:
         Full model name string from configuration.
         Falls back to sonnet if key is not found.
     """
-    model_map = {
-        "sonnet": config.models.sonnet,
-        "opus": config.models.opus,
-        "fable": config.models.fable,
-        "haiku": config.models.haiku,
-        "sonnet_1m": config.models.sonnet_1m,
-    }
-    return model_map.get(model_key.lower(), config.models.sonnet)
+    key = model_key.lower()
+    return getattr(config.models, key) if key in _MODEL_KEYS else config.models.sonnet
 
 
-def get_tools_for_phase(config: ClaudeTaskMasterConfig, phase: str) -> list[str]:
+def get_tools_for_phase(config: ClaudeTaskMasterConfig, phase: str) -> tuple[str, ...]:
     """Get the allowed tools for a specific execution phase.
 
     Args:
@@ -335,11 +391,7 @@ def get_tools_for_phase(config: ClaudeTaskMasterConfig, phase: str) -> list[str]
         phase: The phase name ("planning", "verification", "working").
 
     Returns:
-        List of allowed tool names. Empty list means all tools allowed.
+        Tuple of allowed tool names. Empty tuple means all tools allowed.
     """
-    phase_map = {
-        "planning": config.tools.planning,
-        "verification": config.tools.verification,
-        "working": config.tools.working,
-    }
-    return phase_map.get(phase.lower(), [])
+    key = phase.lower()
+    return getattr(config.tools, key) if key in _PHASE_KEYS else ()
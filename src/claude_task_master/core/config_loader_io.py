@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import os
 from pathlib import Path
 from typing import Any
@@ -10,6 +9,7 @@ from typing import Any
 from claude_task_master.core.config import (
     ClaudeTaskMasterConfig,
     generate_default_config_json,
+    load_config_json,
 )
 from claude_task_master.core.profiles import active_profile_env_safe
 
@@ -104,10 +104,7 @@ def load_config_from_file(config_path: Path) -> ClaudeTaskMasterConfig:
         json.JSONDecodeError: If the file is not valid JSON.
         ValidationError: If the JSON doesn't match the schema.
     """
-    with open(config_path, encoding="utf-8") as f:
-        data = json.load(f)
-
-    return ClaudeTaskMasterConfig.model_validate(data)
+    return load_config_json(config_path.read_bytes())
 
 
 def save_config_to_file(
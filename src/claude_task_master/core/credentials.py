@@ -93,22 +93,25 @@ class NetworkConnectionError(TokenRefreshError):
         )
 
 
+# Explanations for the token endpoint's HTTP error statuses, built once at import.
+_HTTP_ERROR_MESSAGES: dict[int, str] = {
+    400: "Bad request - the refresh token may be malformed",
+    401: "Unauthorized - the refresh token may be invalid or expired",
+    403: "Forbidden - you may not have permission to refresh this token",
+    404: "Token endpoint not found - the API URL may have changed",
+    429: "Rate limited - too many refresh attempts, please try again later",
+    500: "Server error - the authentication server is experiencing issues",
+    502: "Bad gateway - the authentication server may be temporarily unavailable",
+    503: "Service unavailable - the authentication server is temporarily unavailable",
+}
+
+
 class TokenRefreshHTTPError(TokenRefreshError):
     """Raised when the token refresh endpoint returns an HTTP error."""
 
     def __init__(self, status_code: int, response_body: str | None = None):
         self.response_body = response_body
-        error_messages = {
-            400: "Bad request - the refresh token may be malformed",
-            401: "Unauthorized - the refresh token may be invalid or expired",
-            403: "Forbidden - you may not have permission to refresh this token",
-            404: "Token endpoint not found - the API URL may have changed",
-            429: "Rate limited - too many refresh attempts, please try again later",
-            500: "Server error - the authentication server is experiencing issues",
-            502: "Bad gateway - the authentication server may be temporarily unavailable",
-            503: "Service unavailable - the authentication server is temporarily unavailable",
-        }
-        message = error_messages.get(status_code, f"HTTP error {status_code}")
+        message = _HTTP_ERROR_MESSAGES.get(status_code, f"HTTP error {status_code}")
         details = response_body if response_body else None
         super().__init__(f"Token refresh failed: {message}", details, status_code)
 
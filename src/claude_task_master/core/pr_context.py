@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import json
-import shutil
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 from ..github.ci_logs import CILogDownloader  # noqa: F401 — re-exported for backwards compat
@@ -14,10 +15,13 @@ from .pr_context_types import (
     MUTATION_BATCH_SIZE,  # noqa: F401
     _chunks,  # noqa: F401
     _conversation_thread_key,
+    _discard_dir,
     _ThreadState,  # noqa: F401
 )
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from ..github import GitHubClient
     from .state import StateManager
 
@@ -57,7 +61,7 @@ class PRContextManager(_PRContextCIMixin, _PRContextResolveMixin):
 
         # Also save CI failures when saving comments (for complete context)
         if _also_save_ci:
-            self.save_ci_failures(pr_number, _also_save_comments=False)
+            return self._save_pr_feedback(pr_number)
 
         try:
             # Get repository info
@@ -133,7 +137,7 @@ class PRContextManager(_PRContextCIMixin, _PRContextResolveMixin):
             # existing data if any API call above fails.
             comments_dir = pr_dir / "comments"
             if comments_dir.exists():
-                shutil.rmtree(comments_dir)
+                _discard_dir(comments_dir)
             summary_file = pr_dir / "comments_summary.txt"
             if summary_file.exists():
                 summary_file.unlink()
@@ -146,6 +150,26 @@ class PRContextManager(_PRContextCIMixin, _PRContextResolveMixin):
             console.warning(f"Could not save PR comments: {e}")
             return 0
 
+    def _save_pr_feedback(self, pr_number: int) -> int:
+        """Save CI failures and PR comments, fetching both concurrently.
+
+        The two saves hit independent endpoints and write to separate
+        ``ci/`` and ``comments/`` subdirectories, so the CI save runs on a
+        worker thread while comments are fetched on this one. Wall-clock is
+        the slower of the two rather than their sum.
+
+        Args:
+            pr_number: The PR number.
+
+        Returns:
+            Number of actionable comment files saved.
+        """
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            ci_save = pool.submit(self.save_ci_failures, pr_number, _also_save_comments=False)
+            saved = self.save_pr_comments(pr_number, _also_save_ci=False)
+            ci_save.result()
+        return saved
+
     def _fetch_conversation_comments(
         self, repo_info: str, pr_number: int, addressed_threads: set[str]
     ) -> list[dict[str, object]]:
@@ -359,13 +383,9 @@ class PRContextManager(_PRContextCIMixin, _PRContextResolveMixin):
         if pr_number is None:
             return False
 
+        # Read-only probe: don't create the PR directory just to look inside it.
         try:
-            pr_dir = self.state_manager.get_pr_dir(pr_number)
-            comments_dir = pr_dir / "comments"
-            if not comments_dir.exists():
-                return False
-            comment_files = list(comments_dir.glob("*.txt"))
-            return len(comment_files) > 0
+            return _has_comment_files(self.state_manager._pr_dir_path(pr_number))
         except Exception:
             return False
 
@@ -382,13 +402,7 @@ class PRContextManager(_PRContextCIMixin, _PRContextResolveMixin):
             return False
 
         try:
-            pr_dir = self.state_manager.get_pr_dir(pr_number)
-            ci_dir = pr_dir / "ci"
-            if not ci_dir.exists():
-                return False
-            # Check for log files in job subdirectories (new chunked format)
-            ci_files = list(ci_dir.rglob("*.log"))
-            return len(ci_files) > 0
+            return _has_ci_logs(self.state_manager._pr_dir_path(pr_number))
         except Exception:
             return False
 
@@ -407,10 +421,32 @@ class PRContextManager(_PRContextCIMixin, _PRContextResolveMixin):
         if pr_number is None:
             return (False, False, "")
 
+        # Resolve the PR directory once and probe both subdirectories from it.
         pr_dir = self.state_manager.get_pr_dir(pr_number)
-        pr_dir_path = str(pr_dir)
+        return (_has_ci_logs(pr_dir), _has_comment_files(pr_dir), str(pr_dir))
 
-        has_ci = self.has_ci_failures(pr_number)
-        has_comments = self.has_pr_comments(pr_number)
 
-        return (has_ci, has_comments, pr_dir_path)
+def _has_comment_files(pr_dir: Path) -> bool:
+    """Return True if ``pr_dir/comments`` holds at least one saved comment file.
+
+    One scandir that stops at the first ``.txt`` entry; a missing or unreadable
+    directory counts as no comments.
+    """
+    try:
+        with os.scandir(pr_dir / "comments") as entries:
+            return any(entry.name.endswith(".txt") for entry in entries)
+    except OSError:
+        return False
+
+
+def _has_ci_logs(pr_dir: Path) -> bool:
+    """Return True if ``pr_dir/ci`` holds at least one saved CI log.
+
+    Logs live in per-job subdirectories (chunked format), so this searches
+    recursively but stops at the first match; rglob yields nothing if ci/ is
+    missing.
+    """
+    try:
+        return next((pr_dir / "ci").rglob("*.log"), None) is not None
+    except OSError:
+        return False
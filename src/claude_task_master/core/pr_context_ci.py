@@ -5,10 +5,10 @@ Provides :class:`_PRContextCIMixin` with :meth:`save_ci_failures`.
 
 from __future__ import annotations
 
-import shutil
 from typing import TYPE_CHECKING
 
 from ..github.ci_logs import CILogDownloader
+from .pr_context_types import _discard_dir
 
 if TYPE_CHECKING:
     from ..github import GitHubClient
@@ -102,6 +102,12 @@ class _PRContextCIMixin:
         if pr_number is None:
             return
 
+        # Also save comments when saving CI failures (for complete context);
+        # both fetches run concurrently.
+        if _also_save_comments:
+            self._save_pr_feedback(pr_number)  # type: ignore[attr-defined]
+            return
+
         # Deferred import so tests can patch pr_context.console
         import claude_task_master.core.pr_context as _pr  # noqa: PLC0415
 
@@ -124,7 +130,7 @@ class _PRContextCIMixin:
             if not has_failures:
                 # CI is now passing — clear any stale failure logs
                 if ci_dir.exists():
-                    shutil.rmtree(ci_dir)
+                    _discard_dir(ci_dir)
                 return  # No failures to download
 
             # Extract run IDs from *failing* checks only (distinct set).
@@ -155,7 +161,7 @@ class _PRContextCIMixin:
             # Clear old CI logs only after we have confirmed run IDs and repo —
             # preserves existing data if the status/repo calls fail above.
             if ci_dir.exists():
-                shutil.rmtree(ci_dir)
+                _discard_dir(ci_dir)
             ci_dir.mkdir(parents=True, exist_ok=True)
 
             # Every failing run, not just one of them. A PR fans out to several
@@ -202,10 +208,5 @@ class _PRContextCIMixin:
             _console.warning(f"Could not save CI failures: {e}")
             _console.detail(f"Full error: {traceback.format_exc()}")
 
-        # Also save comments when saving CI failures (for complete context)
-        # Do this AFTER saving CI failures to ensure CI files exist first
-        if _also_save_comments:
-            self.save_pr_comments(pr_number, _also_save_ci=False)  # type: ignore[attr-defined]
-
 
 __all__ = ["_PRContextCIMixin", "_run_ids_from_checks"]
@@ -6,8 +6,16 @@ pr_context_ci.py, and pr_context_resolve.py.
 
 from __future__ import annotations
 
+import os
+import shutil
+import threading
+import uuid
 from collections.abc import Iterator
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 # Prefix marking PR conversation (issue-level) comments. These live on the
 # issues endpoint and are NOT resolvable review threads, so they are tracked
@@ -43,10 +51,46 @@ def _chunks(items: list[str], size: int) -> Iterator[list[str]]:
         yield items[start : start + size]
 
 
+def _discard_dir(directory: Path) -> threading.Thread | None:
+    """Remove ``directory`` from view at once and delete its contents off-thread.
+
+    A single rename moves the old tree aside (to ``.{name}.old.{uuid}``), so
+    callers can recreate the directory straight away however many files it
+    held; the ``rmtree`` walk then runs on a daemon thread. A daemon thread
+    dies with the interpreter, so tombs left by a run that exited early are
+    deleted here first. If the rename fails (e.g. a file locked on Windows),
+    falls back to deleting in place.
+
+    Args:
+        directory: An existing directory to discard.
+
+    Returns:
+        The cleanup thread, or None when the directory was deleted in place.
+    """
+    for leftover in directory.parent.glob(f".{directory.name}.old.*"):
+        shutil.rmtree(leftover, ignore_errors=True)
+    tomb = directory.with_name(f".{directory.name}.old.{uuid.uuid4().hex}")
+    try:
+        os.rename(directory, tomb)
+    except OSError:
+        shutil.rmtree(directory)
+        return None
+    cleanup = threading.Thread(
+        target=shutil.rmtree,
+        args=(tomb,),
+        kwargs={"ignore_errors": True},
+        name="pr-context-cleanup",
+        daemon=True,
+    )
+    cleanup.start()
+    return cleanup
+
+
 __all__ = [
     "_CONVERSATION_THREAD_PREFIX",
     "MUTATION_BATCH_SIZE",
     "_ThreadState",
     "_conversation_thread_key",
     "_chunks",
+    "_discard_dir",
 ]
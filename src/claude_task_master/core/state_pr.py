@@ -66,7 +66,9 @@ class PRContextMixin:
     def save_pr_comments(self, pr_number: int, comments: list[dict]) -> None:
         """Save PR comments to files for Claude to read.
 
-        Each comment is saved to a separate file for easy reading.
+        Each comment is saved to a separate file for easy reading. The files
+        are regenerated from GitHub on every fetch, so like the CI log chunks
+        they are written plainly rather than fsynced one by one.
 
         Args:
             pr_number: The PR number.
@@ -106,7 +108,7 @@ Status: {"Resolved" if is_resolved else "Unresolved"}
 
 {body}
 """
-            atomic_write_text(comments_dir / filename, content)
+            (comments_dir / filename).write_text(content, encoding="utf-8")
 
         # Also save a summary file
         summary_file = pr_dir / "comments_summary.txt"
@@ -188,7 +190,9 @@ Status: {"Resolved" if is_resolved else "Unresolved"}
         # Use the same path structure as get_pr_dir
         pr_dir = self.state_dir / "debugging" / "pr" / str(pr_number)
         if pr_dir.exists():
-            shutil.rmtree(pr_dir)
+            # Also takes any ``.{name}.old.*`` tombs left by _discard_dir. A cleanup
+            # thread may be deleting one of them concurrently, hence ignore_errors.
+            shutil.rmtree(pr_dir, ignore_errors=True)
 
     def get_addressed_threads(self, pr_number: int) -> set[str]:
         """Get the set of thread IDs that have already been addressed.
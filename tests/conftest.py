@@ -90,21 +90,25 @@ def mock_expired_credentials_data() -> dict[str, Any]:
 
 
 @pytest.fixture
-def mock_credentials_file(temp_dir: Path, mock_credentials_data: dict[str, Any]) -> Path:
+def credentials_path(temp_dir: Path) -> Path:
+    """Return ``.claude/.credentials.json`` under temp_dir, with its directory created."""
+    path = temp_dir / ".claude" / ".credentials.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+@pytest.fixture
+def mock_credentials_file(credentials_path: Path, mock_credentials_data: dict[str, Any]) -> Path:
     """Create a mock credentials file and return its path."""
-    credentials_path = temp_dir / ".claude" / ".credentials.json"
-    credentials_path.parent.mkdir(parents=True, exist_ok=True)
     credentials_path.write_text(json.dumps(mock_credentials_data))
     return credentials_path
 
 
 @pytest.fixture
 def mock_expired_credentials_file(
-    temp_dir: Path, mock_expired_credentials_data: dict[str, Any]
+    credentials_path: Path, mock_expired_credentials_data: dict[str, Any]
 ) -> Path:
     """Create a mock expired credentials file and return its path."""
-    credentials_path = temp_dir / ".claude" / ".credentials.json"
-    credentials_path.parent.mkdir(parents=True, exist_ok=True)
     credentials_path.write_text(json.dumps(mock_expired_credentials_data))
     return credentials_path
 
@@ -543,9 +547,13 @@ def mock_doctor_checks():
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def event_loop_policy():
-    """Provide the default event loop policy for async tests."""
+    """Provide the default event loop policy for async tests.
+
+    Session-scoped (like pytest-asyncio's own) so modules can opt into a
+    wider ``loop_scope`` without a scope mismatch.
+    """
     import asyncio
 
     return asyncio.DefaultEventLoopPolicy()
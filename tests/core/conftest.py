@@ -11,7 +11,8 @@ Note: Basic fixtures like `state_manager`, `initialized_state_manager`,
 `temp_dir`, and `sample_task_options` are provided by the root conftest.py.
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import sys
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -23,15 +24,25 @@ from claude_task_master.core.rate_limit import RateLimitConfig
 # =============================================================================
 
 
+async def _empty_query(*args, **kwargs):
+    """Stand-in for ``claude_agent_sdk.query`` that yields no messages.
+
+    Tests that need messages replace ``agent.query`` with their own generator,
+    so a plain async generator is enough; no AsyncMock is built per SDK mock.
+    """
+    return
+    yield  # Make it an async generator
+
+
 @pytest.fixture
 def mock_sdk():
     """Create a mock Claude Agent SDK with query and options class.
 
     Returns:
-        MagicMock: A mock SDK with query as AsyncMock and ClaudeAgentOptions.
+        MagicMock: A mock SDK with an empty query generator and ClaudeAgentOptions.
     """
     mock = MagicMock()
-    mock.query = AsyncMock()
+    mock.query = _empty_query
     mock.ClaudeAgentOptions = MagicMock()
     return mock
 
@@ -50,11 +61,69 @@ def mock_sdk_in_modules(mock_sdk):
         yield mock_sdk
 
 
+@pytest.fixture(scope="module")
+def module_mock_sdk():
+    """Create a mock Claude Agent SDK shared by every test in a module.
+
+    Use this (via ``shared_agent``) for read-only tests; tests that configure
+    ``query`` or ``ClaudeAgentOptions`` should keep using ``mock_sdk``.
+
+    Returns:
+        MagicMock: A mock SDK with an empty query generator and ClaudeAgentOptions.
+    """
+    mock = MagicMock()
+    mock.query = _empty_query
+    mock.ClaudeAgentOptions = MagicMock()
+    return mock
+
+
+@pytest.fixture(scope="module")
+def fake_claude_sdk(module_mock_sdk):
+    """Install the module's mock SDK as ``claude_agent_sdk`` for a whole module.
+
+    Opt in with ``pytestmark = pytest.mark.usefixtures("fake_claude_sdk")`` so
+    constructor tests can build AgentWrapper without a per-test ``patch.dict``.
+    This is not session-wide because some tests (e.g. test_subagents.py) import
+    the real SDK. Tests that need a missing or broken SDK still override it
+    locally with ``patch.dict``.
+
+    Yields:
+        MagicMock: The mock SDK module.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "claude_agent_sdk", module_mock_sdk)
+        yield module_mock_sdk
+
+
 # =============================================================================
 # Agent Fixtures
 # =============================================================================
 
 
+@pytest.fixture(scope="module")
+def shared_agent(tmp_path_factory, module_mock_sdk):
+    """Create one AgentWrapper instance shared by every test in a module.
+
+    Only use this for tests that read from the agent (model names, tool
+    lists, error classification). Tests that patch methods or attributes must
+    do so with ``patch.object`` or ``monkeypatch`` so the shared instance is
+    restored.
+
+    Args:
+        tmp_path_factory: Built-in session temp directory factory
+        module_mock_sdk: Module-scoped mock SDK fixture
+
+    Returns:
+        AgentWrapper: An AgentWrapper instance configured with test defaults.
+    """
+    with patch.dict("sys.modules", {"claude_agent_sdk": module_mock_sdk}):
+        return AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+            working_dir=str(tmp_path_factory.mktemp("shared_agent")),
+        )
+
+
 @pytest.fixture
 def agent_with_temp_dir(temp_dir, mock_sdk):
     """Create an AgentWrapper instance with a temporary working directory.
@@ -28,6 +28,8 @@ from claude_task_master.core.agent_exceptions import (
     WorkingDirectoryError,
 )
 
+pytestmark = [pytest.mark.fast, pytest.mark.usefixtures("fake_claude_sdk")]
+
 # =============================================================================
 # AgentError Base Exception Tests
 # =============================================================================
@@ -501,16 +503,11 @@ class TestAgentWrapperErrorClassification:
     @pytest.fixture
     def agent(self, temp_dir):
         """Create an AgentWrapper instance for testing."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-                working_dir=str(temp_dir),
-            )
+        agent = AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+            working_dir=str(temp_dir),
+        )
         return agent
 
     def test_classify_rate_limit_error(self, agent):
@@ -655,16 +652,11 @@ class TestAgentWrapperWorkingDirectoryErrors:
     @pytest.fixture
     def agent(self, temp_dir):
         """Create an AgentWrapper instance for testing."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-                working_dir="/nonexistent/directory",
-            )
+        agent = AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+            working_dir="/nonexistent/directory",
+        )
         return agent
 
     @pytest.mark.asyncio
@@ -679,16 +671,11 @@ class TestAgentWrapperWorkingDirectoryErrors:
     @pytest.mark.asyncio
     async def test_working_directory_permission_error(self, temp_dir):
         """Test error when working directory is inaccessible (os.path.isdir returns False)."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-                working_dir=str(temp_dir),
-            )
+        agent = AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+            working_dir=str(temp_dir),
+        )
 
         # os.path.isdir returning False simulates a missing or inaccessible path.
         # The old code used os.chdir; the new code validates with isdir so we
@@ -702,17 +689,12 @@ class TestAgentWrapperWorkingDirectoryErrors:
     @pytest.mark.asyncio
     async def test_working_directory_error_includes_path(self, temp_dir):
         """Test WorkingDirectoryError includes the path that failed."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
         nonexistent_path = "/path/that/does/not/exist"
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-                working_dir=nonexistent_path,
-            )
+        agent = AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+            working_dir=nonexistent_path,
+        )
 
         with pytest.raises(WorkingDirectoryError) as exc_info:
             await agent._query_executor._execute_query("test prompt", ["Read"])
@@ -798,16 +780,11 @@ class TestErrorHandlingEdgeCases:
     @pytest.fixture
     def agent(self, temp_dir):
         """Create an AgentWrapper instance for testing."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            return AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-                working_dir=str(temp_dir),
-            )
+        return AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+            working_dir=str(temp_dir),
+        )
 
     def test_classify_empty_error_message(self, agent):
         """Test classification of error with empty message."""
@@ -7,7 +7,8 @@ This module contains tests for:
 """
 
 import os
-from unittest.mock import AsyncMock, MagicMock, patch
+import sys
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -19,6 +20,8 @@ from claude_task_master.core.agent_exceptions import (
 )
 from claude_task_master.core.rate_limit import RateLimitConfig
 
+pytestmark = [pytest.mark.fast, pytest.mark.usefixtures("fake_claude_sdk")]
+
 # =============================================================================
 # AgentWrapper Initialization Tests
 # =============================================================================
@@ -29,16 +32,11 @@ class TestAgentWrapperInitialization:
 
     def test_init_with_valid_parameters(self):
         """Test initialization with valid parameters."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-                working_dir="/test/dir",
-            )
+        agent = AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+            working_dir="/test/dir",
+        )
 
         assert agent.access_token == "test-token"
         assert agent.model == ModelType.SONNET
@@ -46,50 +44,40 @@ class TestAgentWrapperInitialization:
 
     def test_init_default_working_dir(self):
         """Test initialization with default working directory."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=ModelType.OPUS,
-            )
+        agent = AgentWrapper(
+            access_token="test-token",
+            model=ModelType.OPUS,
+        )
 
         assert agent.working_dir == "."
 
-    def test_init_with_different_models(self):
-        """Test initialization with different model types."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            for model in ModelType:
-                agent = AgentWrapper(
-                    access_token="test-token",
-                    model=model,
-                )
-                assert agent.model == model
+    @pytest.mark.parametrize("model", list(ModelType), ids=lambda m: m.value)
+    def test_init_with_model(self, model):
+        """Test initialization with each model type."""
+        agent = AgentWrapper(
+            access_token="test-token",
+            model=model,
+        )
+        assert agent.model is model
 
-    def test_init_without_claude_sdk_raises_error(self):
+    def test_init_without_claude_sdk_raises_error(self, monkeypatch):
         """Test initialization without claude-agent-sdk raises SDKImportError."""
-        # Patch the import to simulate missing module
-        with patch.dict("sys.modules", {"claude_agent_sdk": None}):
-            with pytest.raises(SDKImportError) as exc_info:
-                # Force the import to fail
-                with patch("builtins.__import__", side_effect=ImportError):
-                    AgentWrapper(
-                        access_token="test-token",
-                        model=ModelType.SONNET,
-                    )
+        # A None entry in sys.modules makes the import fail without touching
+        # builtins.__import__ for everything else.
+        monkeypatch.setitem(sys.modules, "claude_agent_sdk", None)
+
+        with pytest.raises(SDKImportError) as exc_info:
+            AgentWrapper(
+                access_token="test-token",
+                model=ModelType.SONNET,
+            )
 
         assert "claude-agent-sdk not installed" in str(exc_info.value)
 
     def test_init_stores_sdk_components(self):
         """Test initialization stores SDK query and options class."""
         mock_sdk = MagicMock()
-        mock_query = AsyncMock()
+        mock_query = MagicMock()
         mock_options_class = MagicMock()
         mock_sdk.query = mock_query
         mock_sdk.ClaudeAgentOptions = mock_options_class
@@ -105,32 +93,22 @@ class TestAgentWrapperInitialization:
 
     def test_init_with_custom_rate_limit_config(self):
         """Test initialization with custom RateLimitConfig."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
         rate_limit_config = RateLimitConfig(max_retries=5)
 
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-                rate_limit_config=rate_limit_config,
-            )
+        agent = AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+            rate_limit_config=rate_limit_config,
+        )
 
         assert agent.rate_limit_config.max_retries == 5
 
     def test_init_with_default_rate_limit_config(self):
         """Test default rate limit configuration values."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-            )
+        agent = AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+        )
 
         default_config = RateLimitConfig.default()
         assert agent.rate_limit_config.max_retries == default_config.max_retries
@@ -163,7 +141,7 @@ class TestAgentWrapperSDKImport:
     def test_missing_options_class(self):
         """Test error when SDK is missing ClaudeAgentOptions."""
         mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
+        mock_sdk.query = MagicMock()
         del mock_sdk.ClaudeAgentOptions
 
         with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
@@ -215,16 +193,11 @@ class TestAgentWrapperWorkingDirectoryErrors:
     @pytest.fixture
     def agent(self, temp_dir):
         """Create an AgentWrapper instance for testing."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-                working_dir="/nonexistent/directory",
-            )
+        agent = AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+            working_dir="/nonexistent/directory",
+        )
         return agent
 
     @pytest.mark.asyncio
@@ -239,16 +212,11 @@ class TestAgentWrapperWorkingDirectoryErrors:
     @pytest.mark.asyncio
     async def test_working_directory_permission_error(self, temp_dir):
         """Test error when working directory is inaccessible (os.path.isdir returns False)."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-                working_dir=str(temp_dir),
-            )
+        agent = AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+            working_dir=str(temp_dir),
+        )
 
         # os.path.isdir returning False simulates a missing or inaccessible path.
         # _execute_query no longer uses os.chdir; it validates with os.path.isdir
@@ -262,18 +230,13 @@ class TestAgentWrapperWorkingDirectoryErrors:
     @pytest.mark.asyncio
     async def test_query_does_not_chdir(self, temp_dir):
         """Test that _execute_query does not change process working directory."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
         original_dir = os.getcwd()
 
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-                working_dir=str(temp_dir),
-            )
+        agent = AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+            working_dir=str(temp_dir),
+        )
 
         # Create async generator that yields a mock message
         async def mock_query_gen(*args, **kwargs):
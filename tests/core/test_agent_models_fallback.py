@@ -25,6 +25,8 @@ from claude_task_master.core.agent_models import (
     parse_task_complexity,
 )
 
+pytestmark = [pytest.mark.fast, pytest.mark.usefixtures("fake_claude_sdk")]
+
 # =============================================================================
 # Routing table integrity (chain + effort + tag combined)
 # =============================================================================
@@ -151,19 +153,14 @@ class TestEffortPassedToOptions:
         from claude_task_master.core.agent import AgentWrapper
         from claude_task_master.core.rate_limit import RateLimitConfig
 
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="tok",
-                model=model,
-                working_dir=str(temp_dir),
-                rate_limit_config=RateLimitConfig(
-                    max_retries=0, initial_backoff=0.01, max_backoff=0.01
-                ),
-            )
+        agent = AgentWrapper(
+            access_token="tok",
+            model=model,
+            working_dir=str(temp_dir),
+            rate_limit_config=RateLimitConfig(
+                max_retries=0, initial_backoff=0.01, max_backoff=0.01
+            ),
+        )
         return agent
 
     @staticmethod
@@ -232,19 +229,14 @@ class TestMultiHopFallback:
         from claude_task_master.core.agent import AgentWrapper
         from claude_task_master.core.rate_limit import RateLimitConfig
 
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="tok",
-                model=ModelType.FABLE,
-                working_dir=str(temp_dir),
-                rate_limit_config=RateLimitConfig(
-                    max_retries=0, initial_backoff=0.01, max_backoff=0.01
-                ),
-            )
+        agent = AgentWrapper(
+            access_token="tok",
+            model=ModelType.FABLE,
+            working_dir=str(temp_dir),
+            rate_limit_config=RateLimitConfig(
+                max_retries=0, initial_backoff=0.01, max_backoff=0.01
+            ),
+        )
         return agent
 
     @pytest.mark.asyncio
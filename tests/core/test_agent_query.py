@@ -12,6 +12,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from claude_task_master.core import console
 from claude_task_master.core.agent import AgentWrapper, ModelType
 from claude_task_master.core.agent_exceptions import (
     APIAuthenticationError,
@@ -26,33 +27,59 @@ from claude_task_master.core.agent_exceptions import (
 )
 from claude_task_master.core.rate_limit import RateLimitConfig
 
+
+def _block(cls_name: str, **attrs: object) -> object:
+    """Build a plain SDK-like message/block whose class is named ``cls_name``.
+
+    Message processing dispatches on ``type(obj).__name__`` and reads the rest
+    with ``getattr``, so a bare instance is enough and avoids MagicMock setup.
+    """
+    obj = type(cls_name, (), {})()
+    obj.__dict__.update(attrs)
+    return obj
+
+
+pytestmark = [pytest.mark.fast, pytest.mark.usefixtures("fake_claude_sdk")]
+
 # =============================================================================
 # AgentWrapper Query Execution Tests
 # =============================================================================
 
 
 class TestAgentWrapperRunQuery:
-    """Tests for _run_query async method."""
+    """Tests for _run_query async method.
+
+    The async tests in this module do no real I/O, so they share one
+    module-scoped event loop instead of creating a loop per test.
+    """
 
     @pytest.fixture
     def agent(self, temp_dir):
         """Create an AgentWrapper instance for testing."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-                working_dir=str(temp_dir),
-            )
+        agent = AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+            working_dir=str(temp_dir),
+        )
         return agent
 
-    @pytest.mark.asyncio
-    async def test_run_query_changes_directory(self, agent, temp_dir):
-        """Test _run_query changes to working directory."""
-        original_dir = os.getcwd()
+    @pytest.fixture
+    def tool_console(self, monkeypatch):
+        """Record console.tool/tool_result messages instead of capturing stdout."""
+        messages: list[str] = []
+
+        def record(message, **kwargs):
+            messages.append(message)
+
+        monkeypatch.setattr(console, "tool", record)
+        monkeypatch.setattr(console, "tool_result", record)
+        return messages
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_run_query_does_not_change_directory(self, agent, monkeypatch):
+        """Test _run_query never calls os.chdir; cwd is passed to the SDK instead."""
+        mock_chdir = MagicMock()
+        monkeypatch.setattr(os, "chdir", mock_chdir)
 
         # Create async generator that yields a mock message
         async def mock_query_gen(*args, **kwargs):
@@ -63,19 +90,19 @@ class TestAgentWrapperRunQuery:
 
         await agent._run_query("test prompt", ["Read"])
 
-        # Should be back in original directory
-        assert os.getcwd() == original_dir
+        mock_chdir.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_run_query_restores_directory_on_error(self, agent, temp_dir):
-        """Test _run_query restores directory even on error.
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_run_query_does_not_change_directory_on_error(self, agent, monkeypatch):
+        """Test _run_query leaves the process directory alone even on error.
 
         An unclassified stream error is retried under the failure budget (an
         unattended run must not die on one hiccup), so a *persistent* one
         surfaces as ConsecutiveFailuresError rather than the first
         QueryExecutionError.
         """
-        original_dir = os.getcwd()
+        mock_chdir = MagicMock()
+        monkeypatch.setattr(os, "chdir", mock_chdir)
 
         # Create async generator that raises an error
         async def mock_query_gen(*args, **kwargs):
@@ -89,10 +116,9 @@ class TestAgentWrapperRunQuery:
             with pytest.raises(ConsecutiveFailuresError):
                 await agent._run_query("test prompt", ["Read"])
 
-        # Should be back in original directory
-        assert os.getcwd() == original_dir
+        mock_chdir.assert_not_called()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_run_query_creates_options(self, agent, temp_dir):
         """Test _run_query creates options with correct parameters."""
         options_calls = []
@@ -116,7 +142,7 @@ class TestAgentWrapperRunQuery:
         assert options_calls[0]["allowed_tools"] == ["Read", "Glob"]
         assert options_calls[0]["permission_mode"] == "bypassPermissions"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_run_query_options_include_max_buffer_size(self, agent, temp_dir):
         """Test _run_query passes max_buffer_size=5MB to ClaudeAgentOptions."""
         options_calls = []
@@ -139,18 +165,11 @@ class TestAgentWrapperRunQuery:
         assert len(options_calls) == 1
         assert options_calls[0]["max_buffer_size"] == 5 * 1024 * 1024
 
-    @pytest.mark.asyncio
-    async def test_run_query_handles_text_block(self, agent, temp_dir, capsys):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_run_query_handles_text_block(self, agent, temp_dir):
         """Test _run_query handles TextBlock messages."""
-        # Create mock TextBlock
-        text_block = MagicMock()
-        type(text_block).__name__ = "TextBlock"
-        text_block.text = "Hello, world!"
-
-        # Create mock message with content
-        mock_message = MagicMock()
-        mock_message.content = [text_block]
-        type(mock_message).__name__ = "AssistantMessage"
+        text_block = _block("TextBlock", text="Hello, world!")
+        mock_message = _block("AssistantMessage", content=[text_block])
 
         async def mock_query_gen(*args, **kwargs):
             yield mock_message
@@ -162,18 +181,11 @@ class TestAgentWrapperRunQuery:
 
         assert "Hello, world!" in result
 
-    @pytest.mark.asyncio
-    async def test_run_query_handles_tool_use_block(self, agent, temp_dir, capsys):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_run_query_handles_tool_use_block(self, agent, temp_dir, tool_console):
         """Test _run_query handles ToolUseBlock messages."""
-        # Create mock ToolUseBlock
-        tool_block = MagicMock()
-        type(tool_block).__name__ = "ToolUseBlock"
-        tool_block.name = "Read"
-
-        # Create mock message with content
-        mock_message = MagicMock()
-        mock_message.content = [tool_block]
-        type(mock_message).__name__ = "AssistantMessage"
+        tool_block = _block("ToolUseBlock", name="Read", input={})
+        mock_message = _block("AssistantMessage", content=[tool_block])
 
         async def mock_query_gen(*args, **kwargs):
             yield mock_message
@@ -183,21 +195,13 @@ class TestAgentWrapperRunQuery:
 
         await agent._run_query("test prompt", ["Read"])
 
-        captured = capsys.readouterr()
-        assert "Using tool: Read" in captured.out
+        assert any("Using tool: Read" in message for message in tool_console)
 
-    @pytest.mark.asyncio
-    async def test_run_query_handles_tool_result_block_success(self, agent, temp_dir, capsys):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_run_query_handles_tool_result_block_success(self, agent, temp_dir, tool_console):
         """Test _run_query handles ToolResultBlock success."""
-        # Create mock ToolResultBlock
-        result_block = MagicMock()
-        type(result_block).__name__ = "ToolResultBlock"
-        result_block.is_error = False
-
-        # Create mock message with content
-        mock_message = MagicMock()
-        mock_message.content = [result_block]
-        type(mock_message).__name__ = "UserMessage"
+        result_block = _block("ToolResultBlock", is_error=False)
+        mock_message = _block("UserMessage", content=[result_block])
 
         async def mock_query_gen(*args, **kwargs):
             yield mock_message
@@ -207,21 +211,13 @@ class TestAgentWrapperRunQuery:
 
         await agent._run_query("test prompt", ["Read"])
 
-        captured = capsys.readouterr()
-        assert "Tool completed" in captured.out
+        assert tool_console == ["Tool completed"]
 
-    @pytest.mark.asyncio
-    async def test_run_query_handles_tool_result_block_error(self, agent, temp_dir, capsys):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_run_query_handles_tool_result_block_error(self, agent, temp_dir, tool_console):
         """Test _run_query handles ToolResultBlock error."""
-        # Create mock ToolResultBlock with error
-        result_block = MagicMock()
-        type(result_block).__name__ = "ToolResultBlock"
-        result_block.is_error = True
-
-        # Create mock message with content
-        mock_message = MagicMock()
-        mock_message.content = [result_block]
-        type(mock_message).__name__ = "UserMessage"
+        result_block = _block("ToolResultBlock", is_error=True)
+        mock_message = _block("UserMessage", content=[result_block])
 
         async def mock_query_gen(*args, **kwargs):
             yield mock_message
@@ -231,17 +227,12 @@ class TestAgentWrapperRunQuery:
 
         await agent._run_query("test prompt", ["Read"])
 
-        captured = capsys.readouterr()
-        assert "Tool error" in captured.out
+        assert tool_console == ["Tool error"]
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_run_query_handles_result_message(self, agent, temp_dir):
         """Test _run_query handles ResultMessage."""
-        # Create mock ResultMessage
-        result_message = MagicMock()
-        type(result_message).__name__ = "ResultMessage"
-        result_message.result = "Final result text"
-        result_message.content = None
+        result_message = _block("ResultMessage", result="Final result text", content=None)
 
         async def mock_query_gen(*args, **kwargs):
             yield result_message
@@ -253,13 +244,10 @@ class TestAgentWrapperRunQuery:
 
         assert result == "Final result text"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_run_query_handles_message_without_content(self, agent, temp_dir):
         """Test _run_query handles messages without content."""
-        # Create mock message without content
-        mock_message = MagicMock()
-        mock_message.content = None
-        type(mock_message).__name__ = "SomeMessage"
+        mock_message = _block("SomeMessage", content=None)
 
         async def mock_query_gen(*args, **kwargs):
             yield mock_message
@@ -277,10 +265,7 @@ class TestAgentWrapperRunQuery:
         None result. Error ResultMessages (max_turns, budget cap) carry
         result=None; overwriting would drop real work and break the str
         contract."""
-        result_message = MagicMock()
-        type(result_message).__name__ = "ResultMessage"
-        result_message.content = None
-        result_message.result = None
+        result_message = _block("ResultMessage", content=None, result=None)
 
         out = agent._query_executor._default_process_message(result_message, "accumulated text")
 
@@ -289,10 +274,7 @@ class TestAgentWrapperRunQuery:
     def test_default_process_message_uses_non_empty_result(self, agent):
         """A successful ResultMessage with real text still replaces the
         accumulated text via the fallback processor."""
-        result_message = MagicMock()
-        type(result_message).__name__ = "ResultMessage"
-        result_message.content = None
-        result_message.result = "final answer"
+        result_message = _block("ResultMessage", content=None, result="final answer")
 
         out = agent._query_executor._default_process_message(result_message, "partial")
 
@@ -310,25 +292,20 @@ class TestAgentWrapperRetryLogic:
     @pytest.fixture
     def agent(self, temp_dir):
         """Create an AgentWrapper instance for testing."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            rate_limit_config = RateLimitConfig(
-                max_retries=2,
-                initial_backoff=0.1,  # Fast backoff for tests
-                max_backoff=0.5,
-            )
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-                working_dir=str(temp_dir),
-                rate_limit_config=rate_limit_config,
-            )
+        rate_limit_config = RateLimitConfig(
+            max_retries=2,
+            initial_backoff=0.1,  # Fast backoff for tests
+            max_backoff=0.5,
+        )
+        agent = AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+            working_dir=str(temp_dir),
+            rate_limit_config=rate_limit_config,
+        )
         return agent
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_retry_on_rate_limit_error(self, agent, temp_dir):
         """Test retry logic on rate limit error."""
         call_count = 0
@@ -349,7 +326,7 @@ class TestAgentWrapperRetryLogic:
         # Should have retried twice before succeeding
         assert call_count == 3
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_retry_on_connection_error(self, agent, temp_dir):
         """Test retry logic on connection error."""
         call_count = 0
@@ -369,7 +346,7 @@ class TestAgentWrapperRetryLogic:
 
         assert call_count == 2
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_retry_on_timeout_error(self, agent, temp_dir):
         """Test retry logic on timeout error."""
         call_count = 0
@@ -389,7 +366,7 @@ class TestAgentWrapperRetryLogic:
 
         assert call_count == 2
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_retry_on_server_error_500(self, agent, temp_dir):
         """Test retry logic on 500 server error."""
         call_count = 0
@@ -409,7 +386,7 @@ class TestAgentWrapperRetryLogic:
 
         assert call_count == 2
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_no_retry_on_auth_error(self, agent, temp_dir):
         """Test authentication errors are not retried."""
         call_count = 0
@@ -429,7 +406,7 @@ class TestAgentWrapperRetryLogic:
         # Should only be called once - no retry
         assert call_count == 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_max_retries_exceeded(self, agent, temp_dir):
         """Test that ConsecutiveFailuresError is raised after max_retries + 1 failures."""
         call_count = 0
@@ -450,7 +427,7 @@ class TestAgentWrapperRetryLogic:
         # max_retries=2, so 3 calls (initial + 2 retries)
         assert call_count == 3
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_successful_first_attempt_no_retry(self, agent, temp_dir):
         """Test no retry on successful first attempt."""
         call_count = 0
@@ -467,7 +444,7 @@ class TestAgentWrapperRetryLogic:
 
         assert call_count == 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_retry_uses_exponential_backoff(self, agent, temp_dir):
         """Test that retries use exponential backoff from rate_limit_config."""
         call_count = 0
@@ -501,7 +478,7 @@ class TestAgentWrapperRetryLogic:
         assert sleep_delays[0] == pytest.approx(0.1)
         assert sleep_delays[1] == pytest.approx(0.2)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_retry_respects_retry_after_for_rate_limits(self, agent, temp_dir):
         """Test that rate limit errors with retry_after use that value."""
         call_count = 0
@@ -540,27 +517,22 @@ class TestAgentWrapperRetryLogic:
         assert len(sleep_delays) == 1
         assert sleep_delays[0] == pytest.approx(0.5)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_max_retries_configurable(self, temp_dir):
         """Test that max_retries from config controls failure threshold."""
         from claude_task_master.core.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
 
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            rate_limit_config = RateLimitConfig(
-                max_retries=4,  # More retries than default (3+1=4 total attempts)
-                initial_backoff=0.01,
-                max_backoff=0.1,
-            )
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-                working_dir=str(temp_dir),
-                rate_limit_config=rate_limit_config,
-            )
+        rate_limit_config = RateLimitConfig(
+            max_retries=4,  # More retries than default (3+1=4 total attempts)
+            initial_backoff=0.01,
+            max_backoff=0.1,
+        )
+        agent = AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+            working_dir=str(temp_dir),
+            rate_limit_config=rate_limit_config,
+        )
 
         # Raise circuit breaker threshold so it doesn't interfere
         agent._query_executor.circuit_breaker = CircuitBreaker(
@@ -611,19 +583,14 @@ class TestStreamIdleTimeoutWatchdog:
     @pytest.fixture
     def agent(self, temp_dir):
         """Create an AgentWrapper instance for testing."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-                working_dir=str(temp_dir),
-            )
+        agent = AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+            working_dir=str(temp_dir),
+        )
         return agent
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_stalled_stream_raises_timeout_then_retries(self, agent):
         """A stream that never yields a message must raise APITimeoutError,
         which feeds the existing retry path (so the prompt is re-attempted).
@@ -662,7 +629,7 @@ class TestStreamIdleTimeoutWatchdog:
         assert attempts == 2
         assert result == "ok"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_two_stream_stalls_raises_consecutive_failures(self, agent):
         """If the stream stalls twice in a row, we must NOT retry forever —
         the per-query stream-idle-timeout cap (2) raises
@@ -684,7 +651,7 @@ class TestStreamIdleTimeoutWatchdog:
             with pytest.raises(ConsecutiveFailuresError):
                 await agent._run_query("test prompt", ["Read"])
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_aclose_called_on_stream(self, agent):
         """The iterator's aclose() must always be called so the SDK transport
         (subprocess, HTTP) is released. Without this, a long-running orchestrator
@@ -718,7 +685,7 @@ class TestStreamIdleTimeoutWatchdog:
         await agent._run_query("test prompt", ["Read"])
         assert aclose_called == [True]
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_aclose_called_even_when_stream_raises(self, agent):
         """aclose() must run even if the stream errors mid-flight."""
         aclose_called = []
@@ -745,7 +712,7 @@ class TestStreamIdleTimeoutWatchdog:
         # aclose called at least once (per retry attempt)
         assert len(aclose_called) >= 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_options_include_cli_stall_env_vars(self, agent):
         """Belt-and-suspenders: the CLI subprocess gets stall timeout env vars
         via ClaudeAgentOptions.env so it can fail-fast on internal stalls
@@ -776,7 +743,7 @@ class TestStreamIdleTimeoutWatchdog:
         assert env["CLAUDE_ASYNC_AGENT_STALL_TIMEOUT_MS"] == expected_ms
         assert env["API_TIMEOUT_MS"] == expected_ms
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_post_completion_missing_result_returns_gracefully(self, agent):
         """When the agent has signaled end_turn with no pending tool_use, a
         missing ResultMessage must NOT trigger a retry (the task is done —
@@ -829,7 +796,7 @@ class TestStreamIdleTimeoutWatchdog:
         # Accumulated text returned as success.
         assert "TASK COMPLETE" in result
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_tool_use_keeps_long_timeout(self, agent):
         """An AssistantMessage with ToolUseBlock means the agent is still
         working — we must NOT switch to the short post-completion timeout
@@ -872,7 +839,7 @@ class TestStreamIdleTimeoutWatchdog:
             with pytest.raises(ConsecutiveFailuresError):
                 await agent._run_query("test prompt", ["Read"])
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_subagent_end_turn_does_not_arm_post_completion_timeout(self, agent):
         """A Task-subagent's end_turn (parent_tool_use_id != None) must NOT
         switch to the short post-completion timeout — the parent is still
@@ -910,7 +877,7 @@ class TestStreamIdleTimeoutWatchdog:
             with pytest.raises(ConsecutiveFailuresError):
                 await agent._run_query("test prompt", ["Read"])
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_successful_query_resets_stream_timeout_counter(self, agent):
         """A successful query must reset the stream-timeout counter so a later
         independent stall doesn't unfairly count against a fresh run."""
@@ -953,19 +920,9 @@ class TestAgentWrapperErrorClassification:
     """Tests for error classification in AgentQueryExecutor."""
 
     @pytest.fixture
-    def agent(self, temp_dir):
-        """Create an AgentWrapper instance for testing."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-                working_dir=str(temp_dir),
-            )
-        return agent
+    def agent(self, shared_agent):
+        """Reuse the module's AgentWrapper; classification never mutates it."""
+        return shared_agent
 
     def test_classify_rate_limit_error(self, agent):
         """Test classification of rate limit errors."""
@@ -1056,16 +1013,11 @@ class TestAgentWrapperProcessMessage:
     @pytest.fixture
     def agent(self, temp_dir):
         """Create an AgentWrapper instance for testing."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            return AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-                working_dir=str(temp_dir),
-            )
+        return AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+            working_dir=str(temp_dir),
+        )
 
     def test_process_message_text_block(self, agent, capsys):
         """Test processing TextBlock messages."""
@@ -1138,19 +1090,14 @@ class TestModelEffortAndFallback:
 
     def _make_agent(self, temp_dir, model):
         """Build an AgentWrapper with a mocked SDK and fast retries."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=model,
-                working_dir=str(temp_dir),
-                rate_limit_config=RateLimitConfig(
-                    max_retries=2, initial_backoff=0.01, max_backoff=0.05
-                ),
-            )
+        agent = AgentWrapper(
+            access_token="test-token",
+            model=model,
+            working_dir=str(temp_dir),
+            rate_limit_config=RateLimitConfig(
+                max_retries=2, initial_backoff=0.01, max_backoff=0.05
+            ),
+        )
         return agent
 
     @staticmethod
@@ -1163,7 +1110,7 @@ class TestModelEffortAndFallback:
 
         return capture
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_fable_gets_max_effort(self, temp_dir):
         """FABLE model → options effort='max' (regression: was None)."""
         agent = self._make_agent(temp_dir, ModelType.FABLE)
@@ -1181,7 +1128,7 @@ class TestModelEffortAndFallback:
 
         assert options_calls[0]["effort"] == "max"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_sonnet_gets_medium_effort(self, temp_dir):
         """SONNET model → options effort='medium'."""
         agent = self._make_agent(temp_dir, ModelType.SONNET)
@@ -1199,7 +1146,7 @@ class TestModelEffortAndFallback:
 
         assert options_calls[0]["effort"] == "medium"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_fallback_model_is_first_chain_hop(self, temp_dir):
         """SDK fallback_model is the first hop of the cycle-guarded chain."""
         agent = self._make_agent(temp_dir, ModelType.SONNET)
@@ -1241,7 +1188,7 @@ class TestModelEffortAndFallback:
         assert not isinstance(classified, ModelUnavailableError)
         assert isinstance(classified, APIConnectionError)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_model_unavailable_falls_back_through_chain(self, temp_dir):
         """A model-unavailable primary recovers on the next chain model."""
         agent = self._make_agent(temp_dir, ModelType.FABLE)
@@ -1270,7 +1217,7 @@ class TestModelEffortAndFallback:
         # Second attempt skips OPUS (already the SDK's auto-fallback) → SONNET.
         assert options_calls[1]["model"] == agent._get_model_name(ModelType.SONNET)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_model_unavailable_chain_exhaustion_raises(self, temp_dir):
         """When every chain model is unavailable, ModelUnavailableError propagates."""
         agent = self._make_agent(temp_dir, ModelType.FABLE)
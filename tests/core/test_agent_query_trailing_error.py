@@ -18,6 +18,8 @@ from claude_task_master.core.agent import AgentWrapper, ModelType
 from claude_task_master.core.agent_exceptions import ConsecutiveFailuresError
 from claude_task_master.core.rate_limit import RateLimitConfig
 
+pytestmark = [pytest.mark.fast, pytest.mark.usefixtures("fake_claude_sdk")]
+
 
 def _result_message(*, is_error: bool = False, subtype: str = "success", result=None):
     """Build a fake SDK ResultMessage (identified by class name, as in prod)."""
@@ -49,16 +51,11 @@ def _text_message(text: str):
 @pytest.fixture
 def agent(temp_dir):
     """Create an AgentWrapper instance for testing."""
-    mock_sdk = MagicMock()
-    mock_sdk.query = AsyncMock()
-    mock_sdk.ClaudeAgentOptions = MagicMock()
-
-    with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-        return AgentWrapper(
-            access_token="test-token",
-            model=ModelType.SONNET,
-            working_dir=str(temp_dir),
-        )
+    return AgentWrapper(
+        access_token="test-token",
+        model=ModelType.SONNET,
+        working_dir=str(temp_dir),
+    )
 
 
 class TestTrailingErrorAfterTerminalResult:
@@ -155,17 +152,12 @@ class TestUnclassifiedErrorRetry:
 
     @pytest.fixture
     def agent(self, temp_dir):
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            return AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-                working_dir=str(temp_dir),
-                rate_limit_config=RateLimitConfig(max_retries=3, initial_backoff=0.01),
-            )
+        return AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+            working_dir=str(temp_dir),
+            rate_limit_config=RateLimitConfig(max_retries=3, initial_backoff=0.01),
+        )
 
     @pytest.mark.asyncio
     async def test_unclassified_error_retries_then_succeeds(self, agent):
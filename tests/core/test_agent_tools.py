@@ -8,7 +8,7 @@ This module contains tests for:
 - Phase tool restrictions
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -16,6 +16,8 @@ from claude_task_master.core.agent import AgentWrapper, ModelType
 from claude_task_master.core.config_loader import reset_config
 from claude_task_master.core.rate_limit import RateLimitConfig
 
+pytestmark = [pytest.mark.fast, pytest.mark.usefixtures("fake_claude_sdk")]
+
 # =============================================================================
 # AgentWrapper Model Name Tests
 # =============================================================================
@@ -24,62 +26,13 @@ from claude_task_master.core.rate_limit import RateLimitConfig
 class TestAgentWrapperGetModelName:
     """Tests for _get_model_name method."""
 
-    @pytest.fixture
-    def mock_sdk(self):
-        """Create mock SDK."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-        return mock_sdk
-
-    def test_sonnet_model_name(self, mock_sdk):
-        """Test SONNET model name mapping returns a valid string."""
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-            )
-        model_name = agent._get_model_name()
-        # Just verify it returns a non-empty string
-        assert model_name
-        assert isinstance(model_name, str)
-
-    def test_opus_model_name(self, mock_sdk):
-        """Test OPUS model name mapping returns a valid string."""
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=ModelType.OPUS,
-            )
-        model_name = agent._get_model_name()
+    @pytest.mark.parametrize("model_type", list(ModelType), ids=lambda m: m.value)
+    def test_model_name(self, shared_agent, model_type):
+        """Test every ModelType maps to a valid model name string."""
+        model_name = shared_agent._get_model_name(model_type)
         # Just verify it returns a non-empty string
-        assert model_name
-        assert isinstance(model_name, str)
-
-    def test_haiku_model_name(self, mock_sdk):
-        """Test HAIKU model name mapping returns a valid string."""
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=ModelType.HAIKU,
-            )
-        model_name = agent._get_model_name()
-        # Just verify it returns a non-empty string
-        assert model_name
-        assert isinstance(model_name, str)
-
-    def test_model_name_for_all_types(self, mock_sdk):
-        """Test all model types return valid model names."""
-        for model_type in ModelType:
-            with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-                agent = AgentWrapper(
-                    access_token="test-token",
-                    model=model_type,
-                )
-            model_name = agent._get_model_name()
-            # Verify it returns a non-empty string
-            assert model_name, f"No model name returned for {model_type}"
-            assert isinstance(model_name, str), f"Model name for {model_type} is not a string"
+        assert model_name, f"No model name returned for {model_type}"
+        assert isinstance(model_name, str), f"Model name for {model_type} is not a string"
 
 
 # =============================================================================
@@ -92,79 +45,55 @@ class TestAgentWrapperCustomConfiguration:
 
     def test_custom_rate_limit_config(self):
         """Test initialization with custom RateLimitConfig."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
         rate_limit_config = RateLimitConfig(max_retries=5)
 
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-                rate_limit_config=rate_limit_config,
-            )
+        agent = AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+            rate_limit_config=rate_limit_config,
+        )
 
         assert agent.rate_limit_config.max_retries == 5
 
     def test_custom_initial_backoff(self):
         """Test initialization with custom initial_backoff."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
         rate_limit_config = RateLimitConfig(initial_backoff=2.0)
 
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-                rate_limit_config=rate_limit_config,
-            )
+        agent = AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+            rate_limit_config=rate_limit_config,
+        )
 
         assert agent.rate_limit_config.initial_backoff == 2.0
 
     def test_custom_max_backoff(self):
         """Test initialization with custom max_backoff."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
         rate_limit_config = RateLimitConfig(max_backoff=60.0)
 
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-                rate_limit_config=rate_limit_config,
-            )
+        agent = AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+            rate_limit_config=rate_limit_config,
+        )
 
         assert agent.rate_limit_config.max_backoff == 60.0
 
     def test_aggressive_rate_limit_config(self):
         """Test initialization with aggressive rate limiting."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
         rate_limit_config = RateLimitConfig.aggressive()
 
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-                rate_limit_config=rate_limit_config,
-            )
+        agent = AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+            rate_limit_config=rate_limit_config,
+        )
 
         assert agent.rate_limit_config == rate_limit_config
         assert agent.rate_limit_config.max_retries == 5
 
     def test_all_custom_config_options(self):
         """Test initialization with all custom configuration options."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
         rate_limit_config = RateLimitConfig(
             max_retries=10,
             initial_backoff=0.5,
@@ -172,13 +101,12 @@ class TestAgentWrapperCustomConfiguration:
             backoff_multiplier=3.0,
         )
 
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            agent = AgentWrapper(
-                access_token="test-token",
-                model=ModelType.OPUS,
-                working_dir="/custom/path",
-                rate_limit_config=rate_limit_config,
-            )
+        agent = AgentWrapper(
+            access_token="test-token",
+            model=ModelType.OPUS,
+            working_dir="/custom/path",
+            rate_limit_config=rate_limit_config,
+        )
 
         assert agent.model == ModelType.OPUS
         assert agent.working_dir == "/custom/path"
@@ -199,16 +127,11 @@ class TestMessageProcessingEdgeCases:
     @pytest.fixture
     def agent(self, temp_dir):
         """Create an AgentWrapper instance for testing."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            return AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-                working_dir=str(temp_dir),
-            )
+        return AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+            working_dir=str(temp_dir),
+        )
 
     def test_process_message_empty_content_list(self, agent):
         """Test processing message with empty content list."""
@@ -452,16 +375,11 @@ class TestToolUsageIntegration:
     @pytest.fixture
     def agent(self, temp_dir):
         """Create an AgentWrapper instance for testing."""
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            return AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-                working_dir=str(temp_dir),
-            )
+        return AgentWrapper(
+            access_token="test-token",
+            model=ModelType.SONNET,
+            working_dir=str(temp_dir),
+        )
 
     @pytest.mark.asyncio
     async def test_options_created_with_correct_tools(self, agent):
@@ -595,23 +513,13 @@ class TestPhaseToolRestrictions:
     """Tests to verify tool restrictions are correctly enforced per phase."""
 
     @pytest.fixture
-    def agent(self, temp_dir, monkeypatch):
-        """Create an AgentWrapper instance for testing."""
+    def agent(self, temp_dir, monkeypatch, shared_agent):
+        """Return the module's shared AgentWrapper with default config loaded."""
         # Change to temp directory to avoid loading local config.json
         monkeypatch.chdir(temp_dir)
         # Reset config to ensure we use default values (not local config.json)
         reset_config()
-
-        mock_sdk = MagicMock()
-        mock_sdk.query = AsyncMock()
-        mock_sdk.ClaudeAgentOptions = MagicMock()
-
-        with patch.dict("sys.modules", {"claude_agent_sdk": mock_sdk}):
-            return AgentWrapper(
-                access_token="test-token",
-                model=ModelType.SONNET,
-                working_dir=str(temp_dir),
-            )
+        return shared_agent
 
     def test_phase_defaults_restrict_planning_and_verification(self, agent):
         """Verify planning/verification default to restricted read-only tool sets."""
@@ -10,33 +10,53 @@ The key behavior being tested:
 """
 
 import json
-import shutil
+import threading
 from collections.abc import Generator
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from claude_task_master.core.pr_context import PRContextManager
 from claude_task_master.core.state import StateManager
+from claude_task_master.core.workflow_stages import WorkflowStageHandler
+
+# Canned gh outputs shared by the save tests, encoded once at import.
+_EMPTY_THREADS_STDOUT = json.dumps(
+    {"data": {"repository": {"pullRequest": {"reviewThreads": {"nodes": []}}}}}
+)
+_FAILED_JOB_STDOUT = json.dumps(
+    {"id": 1, "name": "test", "status": "completed", "conclusion": "failure"}
+)
 
 
 @pytest.fixture
-def state_manager(tmp_path: Path) -> Generator[StateManager, None, None]:
-    """Create a StateManager with a temporary directory."""
-    state_dir = tmp_path / ".claude-task-master"
-    sm = StateManager(state_dir=state_dir)
-    yield sm
-    if state_dir.exists():
-        shutil.rmtree(state_dir)
+def state_manager(tmp_path: Path) -> StateManager:
+    """Create a StateManager with a temporary directory.
+
+    pytest's tmp_path retention handles cleanup, so there is no teardown.
+    """
+    return StateManager(state_dir=tmp_path / ".claude-task-master")
+
+
+@pytest.fixture(scope="module")
+def shared_github_client() -> MagicMock:
+    """Create the module's GitHub client mock once; see mock_github_client."""
+    return MagicMock()
 
 
 @pytest.fixture
-def mock_github_client() -> MagicMock:
-    """Create a mock GitHub client."""
-    mock = MagicMock()
+def mock_github_client(shared_github_client: MagicMock) -> MagicMock:
+    """Provide the shared GitHub client mock, reset and reconfigured per test.
+
+    Tests only set ``return_value``/``side_effect`` on its children, all of
+    which ``reset_mock`` clears.
+    """
+    mock = shared_github_client
+    mock.reset_mock(return_value=True, side_effect=True)
     mock.get_failed_run_logs.return_value = "Test failure: AssertionError in test_main.py"
-    mock.get_pr_status.return_value = MagicMock(
+    mock.get_pr_status.return_value = SimpleNamespace(
         base_branch="main",
         check_details=[
             {"name": "tests", "conclusion": "FAILURE", "status": "COMPLETED"},
@@ -45,12 +65,62 @@ def mock_github_client() -> MagicMock:
     return mock
 
 
+@pytest.fixture
+def mock_run() -> Generator[MagicMock, None, None]:
+    """Patch subprocess.run for the CILogDownloader calls made while saving CI logs.
+
+    ci_logs imports the subprocess module rather than the function, so the
+    patch targets ``subprocess.run`` itself.
+    """
+    with patch("subprocess.run") as mock:
+        yield mock
+
+
 @pytest.fixture
 def pr_context(state_manager: StateManager, mock_github_client: MagicMock) -> PRContextManager:
     """Create a PRContextManager instance."""
     return PRContextManager(state_manager=state_manager, github_client=mock_github_client)
 
 
+@pytest.fixture(
+    scope="module",
+    params=[
+        pytest.param(("none", False, False), id="none"),
+        pytest.param(("ci", True, False), id="ci_only"),
+        pytest.param(("comments", False, True), id="comments_only"),
+        pytest.param(("both", True, True), id="both"),
+        pytest.param(("empty_dirs", False, False), id="empty_dirs"),
+    ],
+)
+def pr_layout(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> tuple[PRContextManager, bool, bool]:
+    """Build one saved-feedback layout for PR 123, shared by the read-only tests.
+
+    Returns:
+        Tuple of (pr_context, expected_has_ci, expected_has_comments).
+    """
+    layout, has_ci, has_comments = request.param
+    state_manager = StateManager(state_dir=tmp_path_factory.mktemp(layout) / ".claude-task-master")
+    pr_dir = state_manager.get_pr_dir(123)
+
+    if layout in ("ci", "both"):
+        ci_dir = pr_dir / "ci" / "Tests"
+        ci_dir.mkdir(parents=True)
+        (ci_dir / "1.log").write_bytes(b"Test failure")
+    if layout in ("comments", "both"):
+        comments_dir = pr_dir / "comments"
+        comments_dir.mkdir(parents=True)
+        (comments_dir / "comment_1.txt").write_bytes(b"Please fix this")
+    if layout == "empty_dirs":
+        # Directories exist but hold no files
+        (pr_dir / "ci").mkdir()
+        (pr_dir / "comments").mkdir()
+
+    pr_context = PRContextManager(state_manager=state_manager, github_client=MagicMock())
+    return pr_context, has_ci, has_comments
+
+
 class TestSaveCIFailuresAlsoSavesComments:
     """Tests that save_ci_failures also saves PR comments."""
 
@@ -59,10 +129,11 @@ class TestSaveCIFailuresAlsoSavesComments:
         pr_context: PRContextManager,
         state_manager: StateManager,
         mock_github_client: MagicMock,
+        mock_run: MagicMock,
     ) -> None:
         """Test that save_ci_failures triggers save_pr_comments by default."""
         # Mock PR status with detailsUrl
-        mock_github_client.get_pr_status.return_value = MagicMock(
+        mock_github_client.get_pr_status.return_value = SimpleNamespace(
             check_details=[
                 {
                     "name": "test",
@@ -75,48 +146,37 @@ class TestSaveCIFailuresAlsoSavesComments:
         # Repo info goes through github_client; CILogDownloader still uses subprocess directly.
         # save_pr_comments REST + GraphQL calls go through _run_gh_command.
         mock_github_client._get_repo_info.return_value = "owner/repo"
-        rest_result = MagicMock()
-        rest_result.stdout = ""  # no review comments (empty NDJSON)
-        graphql_result = MagicMock()
-        graphql_result.stdout = json.dumps(
-            {"data": {"repository": {"pullRequest": {"reviewThreads": {"nodes": []}}}}}
-        )
+        rest_result = SimpleNamespace(stdout="")  # no review comments (empty NDJSON)
+        graphql_result = SimpleNamespace(stdout=_EMPTY_THREADS_STDOUT)
         mock_github_client._run_gh_command.side_effect = [rest_result, graphql_result]
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = [
-                # CILogDownloader -> gh api --paginate --jq .jobs[] .../jobs (NDJSON)
-                MagicMock(
-                    returncode=0,
-                    stdout=json.dumps(
-                        {
-                            "id": 1,
-                            "name": "test",
-                            "status": "completed",
-                            "conclusion": "failure",
-                        }
-                    ),
-                    stderr="",
-                ),
-                # CILogDownloader -> gh api .../jobs/1/logs
-                MagicMock(returncode=0, stdout=b"Test logs", stderr=b""),
-            ]
+        mock_run.side_effect = [
+            # CILogDownloader -> gh api --paginate --jq .jobs[] .../jobs (NDJSON)
+            SimpleNamespace(
+                returncode=0,
+                stdout=_FAILED_JOB_STDOUT,
+                stderr="",
+            ),
+            # CILogDownloader -> gh api .../jobs/1/logs
+            SimpleNamespace(returncode=0, stdout=b"Test logs", stderr=b""),
+        ]
 
-            pr_context.save_ci_failures(123)
+        pr_context.save_ci_failures(123)
 
-            # CILogDownloader used subprocess; comments went through _run_gh_command
-            assert mock_run.call_count >= 2
-            assert mock_github_client._run_gh_command.call_count >= 2
+        # CILogDownloader used subprocess; comments went through _run_gh_command
+        assert mock_run.call_count >= 2
+        assert mock_github_client._run_gh_command.call_count >= 2
 
     def test_save_ci_failures_creates_ci_directory(
         self,
         pr_context: PRContextManager,
         state_manager: StateManager,
         mock_github_client: MagicMock,
+        mock_run: MagicMock,
     ) -> None:
         """Test that save_ci_failures creates CI failure files."""
         # Mock PR status with detailsUrl
-        mock_github_client.get_pr_status.return_value = MagicMock(
+        mock_github_client.get_pr_status.return_value = SimpleNamespace(
             check_details=[
                 {
                     "name": "test",
@@ -128,54 +188,41 @@ class TestSaveCIFailuresAlsoSavesComments:
 
         # Repo info + comments go through github_client; CILogDownloader uses subprocess directly.
         mock_github_client._get_repo_info.return_value = "owner/repo"
-        rest_result = MagicMock()
-        rest_result.stdout = ""  # no review comments (empty NDJSON)
-        graphql_result = MagicMock()
-        graphql_result.stdout = json.dumps(
-            {"data": {"repository": {"pullRequest": {"reviewThreads": {"nodes": []}}}}}
-        )
+        rest_result = SimpleNamespace(stdout="")  # no review comments (empty NDJSON)
+        graphql_result = SimpleNamespace(stdout=_EMPTY_THREADS_STDOUT)
         mock_github_client._run_gh_command.side_effect = [rest_result, graphql_result]
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = [
-                # CILogDownloader -> gh api --paginate --jq .jobs[] .../jobs (NDJSON)
-                MagicMock(
-                    returncode=0,
-                    stdout=json.dumps(
-                        {
-                            "id": 1,
-                            "name": "test",
-                            "status": "completed",
-                            "conclusion": "failure",
-                        }
-                    ),
-                    stderr="",
-                ),
-                # CILogDownloader -> gh api .../jobs/1/logs
-                MagicMock(returncode=0, stdout=b"Test logs", stderr=b""),
-            ]
+        mock_run.side_effect = [
+            # CILogDownloader -> gh api --paginate --jq .jobs[] .../jobs (NDJSON)
+            SimpleNamespace(
+                returncode=0,
+                stdout=_FAILED_JOB_STDOUT,
+                stderr="",
+            ),
+            # CILogDownloader -> gh api .../jobs/1/logs
+            SimpleNamespace(returncode=0, stdout=b"Test logs", stderr=b""),
+        ]
 
-            pr_context.save_ci_failures(123)
+        pr_context.save_ci_failures(123)
 
-            pr_dir = state_manager.get_pr_dir(123)
-            ci_dir = pr_dir / "ci"
-            assert ci_dir.exists()
+        pr_dir = state_manager.get_pr_dir(123)
+        ci_dir = pr_dir / "ci"
+        assert ci_dir.exists()
 
     def test_save_ci_failures_no_recursion(
-        self, pr_context: PRContextManager, state_manager: StateManager
+        self, pr_context: PRContextManager, state_manager: StateManager, mock_run: MagicMock
     ) -> None:
         """Test that _also_save_comments=False prevents recursive calls."""
-        with patch("subprocess.run") as mock_run:
-            # When _also_save_comments=False, save_pr_comments should NOT be called
-            pr_context.save_ci_failures(123, _also_save_comments=False)
+        # When _also_save_comments=False, save_pr_comments should NOT be called
+        pr_context.save_ci_failures(123, _also_save_comments=False)
 
-            # Should not have called subprocess (no comment fetching)
-            # The only calls should be for CI logs
-            for call in mock_run.call_args_list:
-                args = call[0][0] if call[0] else []
-                # Should not have GraphQL calls for comments
-                if "graphql" in args:
-                    pytest.fail("Should not call GraphQL when _also_save_comments=False")
+        # Should not have called subprocess (no comment fetching)
+        # The only calls should be for CI logs
+        for call in mock_run.call_args_list:
+            args = call[0][0] if call[0] else []
+            # Should not have GraphQL calls for comments
+            if "graphql" in args:
+                pytest.fail("Should not call GraphQL when _also_save_comments=False")
 
 
 class TestSavePRCommentsAlsoSavesCI:
@@ -186,10 +233,11 @@ class TestSavePRCommentsAlsoSavesCI:
         pr_context: PRContextManager,
         state_manager: StateManager,
         mock_github_client: MagicMock,
+        mock_run: MagicMock,
     ) -> None:
         """Test that save_pr_comments triggers save_ci_failures by default."""
         # Setup mock to have CI failures with detailsUrl
-        mock_github_client.get_pr_status.return_value = MagicMock(
+        mock_github_client.get_pr_status.return_value = SimpleNamespace(
             check_details=[
                 {
                     "name": "test",
@@ -201,37 +249,25 @@ class TestSavePRCommentsAlsoSavesCI:
 
         # Repo info + comments go through github_client; CILogDownloader uses subprocess directly.
         mock_github_client._get_repo_info.return_value = "owner/repo"
-        rest_result = MagicMock()
-        rest_result.stdout = ""  # no review comments (empty NDJSON)
-        graphql_result = MagicMock()
-        graphql_result.stdout = json.dumps(
-            {"data": {"repository": {"pullRequest": {"reviewThreads": {"nodes": []}}}}}
-        )
+        rest_result = SimpleNamespace(stdout="")  # no review comments (empty NDJSON)
+        graphql_result = SimpleNamespace(stdout=_EMPTY_THREADS_STDOUT)
         mock_github_client._run_gh_command.side_effect = [rest_result, graphql_result]
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = [
-                # CILogDownloader -> gh api --paginate --jq .jobs[] .../jobs (NDJSON)
-                MagicMock(
-                    returncode=0,
-                    stdout=json.dumps(
-                        {
-                            "id": 1,
-                            "name": "test",
-                            "status": "completed",
-                            "conclusion": "failure",
-                        }
-                    ),
-                    stderr="",
-                ),
-                # CILogDownloader -> gh api .../jobs/1/logs
-                MagicMock(returncode=0, stdout=b"Test logs", stderr=b""),
-            ]
+        mock_run.side_effect = [
+            # CILogDownloader -> gh api --paginate --jq .jobs[] .../jobs (NDJSON)
+            SimpleNamespace(
+                returncode=0,
+                stdout=_FAILED_JOB_STDOUT,
+                stderr="",
+            ),
+            # CILogDownloader -> gh api .../jobs/1/logs
+            SimpleNamespace(returncode=0, stdout=b"Test logs", stderr=b""),
+        ]
 
-            pr_context.save_pr_comments(123)
+        pr_context.save_pr_comments(123)
 
-            # Verify get_pr_status was called (CI save was triggered)
-            mock_github_client.get_pr_status.assert_called()
+        # Verify get_pr_status was called (CI save was triggered)
+        mock_github_client.get_pr_status.assert_called()
 
     def test_save_pr_comments_no_recursion(
         self,
@@ -242,12 +278,8 @@ class TestSavePRCommentsAlsoSavesCI:
         """Test that _also_save_ci=False prevents recursive calls."""
         # All gh calls go through github_client (no subprocess for comments path)
         mock_github_client._get_repo_info.return_value = "owner/repo"
-        rest_result = MagicMock()
-        rest_result.stdout = ""  # no review comments (empty NDJSON)
-        graphql_result = MagicMock()
-        graphql_result.stdout = json.dumps(
-            {"data": {"repository": {"pullRequest": {"reviewThreads": {"nodes": []}}}}}
-        )
+        rest_result = SimpleNamespace(stdout="")  # no review comments (empty NDJSON)
+        graphql_result = SimpleNamespace(stdout=_EMPTY_THREADS_STDOUT)
         mock_github_client._run_gh_command.side_effect = [rest_result, graphql_result]
 
         # Reset mock to track only this call
@@ -258,67 +290,48 @@ class TestSavePRCommentsAlsoSavesCI:
         # Should not have called get_pr_status (CI save was skipped)
         mock_github_client.get_pr_status.assert_not_called()
 
-
-class TestGetCombinedFeedback:
-    """Tests for the get_combined_feedback method."""
-
-    def test_get_combined_feedback_with_both(
-        self, pr_context: PRContextManager, state_manager: StateManager
+    @pytest.mark.parametrize("entry_point", ["save_pr_comments", "save_ci_failures"])
+    def test_combined_save_fetches_concurrently(
+        self, pr_context: PRContextManager, entry_point: str
     ) -> None:
-        """Test get_combined_feedback when both CI and comments exist."""
-        # Create CI failure file in new chunked structure
-        pr_dir = state_manager.get_pr_dir(123)
-        ci_dir = pr_dir / "ci" / "Tests"
-        ci_dir.mkdir(parents=True, exist_ok=True)
-        (ci_dir / "1.log").write_text("Test failure")
+        """Test that the CI and comment saves overlap instead of running back to back."""
+        # Each half waits for the other; a serial run would break the barrier.
+        barrier = threading.Barrier(2, timeout=1)
+        calls: list[tuple[str, dict[str, bool]]] = []
 
-        # Create comments file
-        comments_dir = pr_dir / "comments"
-        comments_dir.mkdir(parents=True, exist_ok=True)
-        (comments_dir / "comment_1.txt").write_text("Please fix this")
+        def save_ci(pr_number: int, **kwargs: bool) -> None:
+            calls.append(("ci", kwargs))
+            barrier.wait()
 
-        has_ci, has_comments, pr_dir_path = pr_context.get_combined_feedback(123)
+        def save_comments(pr_number: int, **kwargs: bool) -> int:
+            calls.append(("comments", kwargs))
+            barrier.wait()
+            return 3
 
-        assert has_ci is True
-        assert has_comments is True
-        assert "123" in pr_dir_path
+        with (
+            patch.object(pr_context, "save_ci_failures", side_effect=save_ci),
+            patch.object(pr_context, "save_pr_comments", side_effect=save_comments),
+        ):
+            getattr(PRContextManager, entry_point)(pr_context, 123)
 
-    def test_get_combined_feedback_with_ci_only(
-        self, pr_context: PRContextManager, state_manager: StateManager
-    ) -> None:
-        """Test get_combined_feedback when only CI failures exist."""
-        pr_dir = state_manager.get_pr_dir(123)
-        ci_dir = pr_dir / "ci" / "Tests"
-        ci_dir.mkdir(parents=True, exist_ok=True)
-        (ci_dir / "1.log").write_text("Test failure")
-
-        has_ci, has_comments, pr_dir_path = pr_context.get_combined_feedback(123)
-
-        assert has_ci is True
-        assert has_comments is False
+        assert sorted(calls) == [
+            ("ci", {"_also_save_comments": False}),
+            ("comments", {"_also_save_ci": False}),
+        ]
 
-    def test_get_combined_feedback_with_comments_only(
-        self, pr_context: PRContextManager, state_manager: StateManager
-    ) -> None:
-        """Test get_combined_feedback when only comments exist."""
-        pr_dir = state_manager.get_pr_dir(123)
-        comments_dir = pr_dir / "comments"
-        comments_dir.mkdir(parents=True, exist_ok=True)
-        (comments_dir / "comment_1.txt").write_text("Please fix this")
 
-        has_ci, has_comments, pr_dir_path = pr_context.get_combined_feedback(123)
+class TestGetCombinedFeedback:
+    """Tests for the get_combined_feedback method."""
 
-        assert has_ci is False
-        assert has_comments is True
+    def test_get_combined_feedback(self, pr_layout: tuple[PRContextManager, bool, bool]) -> None:
+        """Test get_combined_feedback reports exactly the feedback saved on disk."""
+        pr_context, expected_ci, expected_comments = pr_layout
 
-    def test_get_combined_feedback_with_neither(
-        self, pr_context: PRContextManager, state_manager: StateManager
-    ) -> None:
-        """Test get_combined_feedback when neither CI nor comments exist."""
         has_ci, has_comments, pr_dir_path = pr_context.get_combined_feedback(123)
 
-        assert has_ci is False
-        assert has_comments is False
+        assert has_ci is expected_ci
+        assert has_comments is expected_comments
+        assert "123" in pr_dir_path
 
     def test_get_combined_feedback_with_none_pr(self, pr_context: PRContextManager) -> None:
         """Test get_combined_feedback with None PR number."""
@@ -332,208 +345,96 @@ class TestGetCombinedFeedback:
 class TestHasCIFailures:
     """Tests for the has_ci_failures method."""
 
-    def test_has_ci_failures_true(
-        self, pr_context: PRContextManager, state_manager: StateManager
-    ) -> None:
-        """Test has_ci_failures returns True when CI files exist."""
-        pr_dir = state_manager.get_pr_dir(123)
-        ci_dir = pr_dir / "ci" / "Tests"
-        ci_dir.mkdir(parents=True, exist_ok=True)
-        (ci_dir / "1.log").write_text("Test failure")
-
-        assert pr_context.has_ci_failures(123) is True
+    def test_has_ci_failures(self, pr_layout: tuple[PRContextManager, bool, bool]) -> None:
+        """Test has_ci_failures is True only when CI log files exist."""
+        pr_context, expected_ci, _ = pr_layout
 
-    def test_has_ci_failures_false(self, pr_context: PRContextManager) -> None:
-        """Test has_ci_failures returns False when no CI files exist."""
-        assert pr_context.has_ci_failures(123) is False
+        assert pr_context.has_ci_failures(123) is expected_ci
 
     def test_has_ci_failures_with_none(self, pr_context: PRContextManager) -> None:
         """Test has_ci_failures returns False for None PR number."""
         assert pr_context.has_ci_failures(None) is False
 
-    def test_has_ci_failures_empty_directory(
-        self, pr_context: PRContextManager, state_manager: StateManager
-    ) -> None:
-        """Test has_ci_failures returns False when CI directory is empty."""
-        pr_dir = state_manager.get_pr_dir(123)
-        ci_dir = pr_dir / "ci"
-        ci_dir.mkdir(parents=True, exist_ok=True)
-        # Directory exists but no files
-
-        assert pr_context.has_ci_failures(123) is False
-
 
 class TestHasPRComments:
     """Tests for the has_pr_comments method."""
 
-    def test_has_pr_comments_true(
-        self, pr_context: PRContextManager, state_manager: StateManager
-    ) -> None:
-        """Test has_pr_comments returns True when comment files exist."""
-        pr_dir = state_manager.get_pr_dir(123)
-        comments_dir = pr_dir / "comments"
-        comments_dir.mkdir(parents=True, exist_ok=True)
-        (comments_dir / "comment_1.txt").write_text("Review comment")
-
-        assert pr_context.has_pr_comments(123) is True
+    def test_has_pr_comments(self, pr_layout: tuple[PRContextManager, bool, bool]) -> None:
+        """Test has_pr_comments is True only when comment files exist."""
+        pr_context, _, expected_comments = pr_layout
 
-    def test_has_pr_comments_false(self, pr_context: PRContextManager) -> None:
-        """Test has_pr_comments returns False when no comment files exist."""
-        assert pr_context.has_pr_comments(123) is False
+        assert pr_context.has_pr_comments(123) is expected_comments
 
     def test_has_pr_comments_with_none(self, pr_context: PRContextManager) -> None:
         """Test has_pr_comments returns False for None PR number."""
         assert pr_context.has_pr_comments(None) is False
 
-    def test_has_pr_comments_empty_directory(
-        self, pr_context: PRContextManager, state_manager: StateManager
-    ) -> None:
-        """Test has_pr_comments returns False when comments directory is empty."""
-        pr_dir = state_manager.get_pr_dir(123)
-        comments_dir = pr_dir / "comments"
-        comments_dir.mkdir(parents=True, exist_ok=True)
-        # Directory exists but no files
-
-        assert pr_context.has_pr_comments(123) is False
-
 
 class TestWorkflowStagesCombinedHandling:
     """Tests for WorkflowStageHandler combined CI + comments handling."""
 
-    @pytest.fixture
-    def mock_agent(self) -> MagicMock:
-        """Create a mock agent wrapper."""
-        mock = MagicMock()
-        mock.run_work_session = MagicMock()
-        return mock
-
-    @pytest.fixture
-    def mock_workflow_state(self) -> MagicMock:
-        """Create a mock task state."""
-        mock = MagicMock()
-        mock.current_pr = 123
-        mock.session_count = 1
-        return mock
-
-    def test_build_combined_task_description_both(
-        self, pr_context: PRContextManager, state_manager: StateManager
-    ) -> None:
-        """Test that task description includes both CI and comments when present."""
-        from claude_task_master.core.workflow_stages import WorkflowStageHandler
-
-        # Set up both CI and comments
-        pr_dir = state_manager.get_pr_dir(123)
-        ci_dir = pr_dir / "ci"
-        ci_dir.mkdir(parents=True, exist_ok=True)
-        (ci_dir / "failed_tests.txt").write_text("Test failure")
-
-        comments_dir = pr_dir / "comments"
-        comments_dir.mkdir(parents=True, exist_ok=True)
-        (comments_dir / "comment_1.txt").write_text("Please fix this")
-
-        # Create handler (agent and github_client can be mocks for this test)
-        handler = WorkflowStageHandler(
-            agent=MagicMock(),
-            state_manager=state_manager,
-            github_client=MagicMock(),
-            pr_context=pr_context,
-        )
-
-        # Build task description
-        task = handler._build_combined_ci_comments_task(
-            pr_number=123,
-            has_ci=True,
-            has_comments=True,
-            pr_dir_path=str(pr_dir),
-        )
-
-        # Verify both are included
-        assert "CI has failed" in task
-        assert "review comments" in task.lower()
-        assert "Fix BOTH" in task
-        assert "ci/" in task
-        assert "comments/" in task
-
-    def test_build_combined_task_description_ci_only(
-        self, pr_context: PRContextManager, state_manager: StateManager
-    ) -> None:
-        """Test that task description handles CI only case."""
-        from claude_task_master.core.workflow_stages import WorkflowStageHandler
-
-        pr_dir = state_manager.get_pr_dir(123)
-        ci_dir = pr_dir / "ci"
-        ci_dir.mkdir(parents=True, exist_ok=True)
-        (ci_dir / "failed_tests.txt").write_text("Test failure")
-
-        handler = WorkflowStageHandler(
-            agent=MagicMock(),
-            state_manager=state_manager,
-            github_client=MagicMock(),
-            pr_context=pr_context,
-        )
-
-        task = handler._build_combined_ci_comments_task(
-            pr_number=123,
-            has_ci=True,
-            has_comments=False,
-            pr_dir_path=str(pr_dir),
-        )
-
-        assert "CI has failed" in task
-        assert "Fix BOTH" not in task
-        assert "ci/" in task
-
-    def test_build_combined_task_description_comments_only(
-        self, pr_context: PRContextManager, state_manager: StateManager
-    ) -> None:
-        """Test that task description handles comments only case."""
-        from claude_task_master.core.workflow_stages import WorkflowStageHandler
+    PR_DIR = ".claude-task-master/debugging/pr/123"
 
-        pr_dir = state_manager.get_pr_dir(123)
-        comments_dir = pr_dir / "comments"
-        comments_dir.mkdir(parents=True, exist_ok=True)
-        (comments_dir / "comment_1.txt").write_text("Please fix this")
+    @pytest.fixture(scope="class")
+    def task_builder(self):
+        """Create one handler for building task descriptions.
 
-        handler = WorkflowStageHandler(
+        _build_combined_ci_comments_task only formats strings, so every
+        collaborator can be a mock and the instance can be shared.
+        """
+        return WorkflowStageHandler(
             agent=MagicMock(),
-            state_manager=state_manager,
+            state_manager=MagicMock(),
             github_client=MagicMock(),
-            pr_context=pr_context,
-        )
-
-        task = handler._build_combined_ci_comments_task(
-            pr_number=123,
-            has_ci=False,
-            has_comments=True,
-            pr_dir_path=str(pr_dir),
+            pr_context=MagicMock(),
         )
 
-        assert "review comments" in task.lower()
-        assert "CI has failed" not in task
-        assert "comments/" in task
-
-    def test_build_combined_task_description_neither(
-        self, pr_context: PRContextManager, state_manager: StateManager
+    @pytest.mark.parametrize(
+        ("has_ci", "has_comments", "pr_dir_path", "must_contain", "must_not_contain"),
+        [
+            pytest.param(
+                True,
+                True,
+                PR_DIR,
+                ["CI has failed", "review comments", "Fix BOTH", "ci/", "comments/"],
+                [],
+                id="both",
+            ),
+            pytest.param(True, False, PR_DIR, ["CI has failed", "ci/"], ["Fix BOTH"], id="ci_only"),
+            pytest.param(
+                False,
+                True,
+                PR_DIR,
+                ["review comments", "comments/"],
+                ["CI has failed"],
+                id="comments_only",
+            ),
+            # Should still produce a valid task
+            pytest.param(False, False, "", ["PR #123"], [], id="neither"),
+        ],
+    )
+    def test_build_combined_task_description(
+        self,
+        task_builder,
+        has_ci: bool,
+        has_comments: bool,
+        pr_dir_path: str,
+        must_contain: list[str],
+        must_not_contain: list[str],
     ) -> None:
-        """Test that task description handles neither case."""
-        from claude_task_master.core.workflow_stages import WorkflowStageHandler
-
-        handler = WorkflowStageHandler(
-            agent=MagicMock(),
-            state_manager=state_manager,
-            github_client=MagicMock(),
-            pr_context=pr_context,
-        )
-
-        task = handler._build_combined_ci_comments_task(
+        """Test the task description covers exactly the feedback that is present."""
+        task = task_builder._build_combined_ci_comments_task(
             pr_number=123,
-            has_ci=False,
-            has_comments=False,
-            pr_dir_path="",
+            has_ci=has_ci,
+            has_comments=has_comments,
+            pr_dir_path=pr_dir_path,
         )
 
-        # Should still produce a valid task
-        assert "PR #123" in task
+        task_lower = task.lower()
+        for fragment in must_contain:
+            assert fragment in task
+        for fragment in must_not_contain:
+            assert fragment.lower() not in task_lower
 
 
 class TestClearingOldData:
@@ -544,6 +445,7 @@ class TestClearingOldData:
         pr_context: PRContextManager,
         state_manager: StateManager,
         mock_github_client: MagicMock,
+        mock_run: MagicMock,
     ) -> None:
         """Test that save_ci_failures clears stale CI logs after a successful fetch.
 
@@ -555,10 +457,10 @@ class TestClearingOldData:
         ci_dir = pr_dir / "ci"
         ci_dir.mkdir(parents=True, exist_ok=True)
         old_file = ci_dir / "old_failure.txt"
-        old_file.write_text("Old failure")
+        old_file.write_bytes(b"Old failure")
 
         # PR status has a failing check WITH a URL containing a valid run ID
-        mock_github_client.get_pr_status.return_value = MagicMock(
+        mock_github_client.get_pr_status.return_value = SimpleNamespace(
             check_details=[
                 {
                     "name": "test",
@@ -569,24 +471,21 @@ class TestClearingOldData:
         )
         mock_github_client._get_repo_info.return_value = "owner/repo"
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = [
-                # CILogDownloader -> gh api --paginate --jq .jobs[] (NDJSON)
-                MagicMock(
-                    returncode=0,
-                    stdout=json.dumps(
-                        {"id": 1, "name": "test", "status": "completed", "conclusion": "failure"}
-                    ),
-                    stderr="",
-                ),
-                # CILogDownloader -> gh api .../jobs/1/logs
-                MagicMock(returncode=0, stdout=b"##[error]Build failed", stderr=b""),
-            ]
+        mock_run.side_effect = [
+            # CILogDownloader -> gh api --paginate --jq .jobs[] (NDJSON)
+            SimpleNamespace(
+                returncode=0,
+                stdout=_FAILED_JOB_STDOUT,
+                stderr="",
+            ),
+            # CILogDownloader -> gh api .../jobs/1/logs
+            SimpleNamespace(returncode=0, stdout=b"##[error]Build failed", stderr=b""),
+        ]
 
-            pr_context.save_ci_failures(123, _also_save_comments=False)
+        pr_context.save_ci_failures(123, _also_save_comments=False)
 
-            # Old file should be gone — cleared before writing new logs
-            assert not old_file.exists()
+        # Old file should be gone — cleared before writing new logs
+        assert not old_file.exists()
 
     def test_save_ci_failures_preserves_old_ci_when_no_run_id(
         self,
@@ -604,10 +503,10 @@ class TestClearingOldData:
         ci_dir = pr_dir / "ci"
         ci_dir.mkdir(parents=True, exist_ok=True)
         old_file = ci_dir / "old_failure.txt"
-        old_file.write_text("Old failure")
+        old_file.write_bytes(b"Old failure")
 
         # Failing check but NO URL → can't extract run ID
-        mock_github_client.get_pr_status.return_value = MagicMock(
+        mock_github_client.get_pr_status.return_value = SimpleNamespace(
             check_details=[{"name": "tests", "conclusion": "FAILURE", "status": "COMPLETED"}]
         )
 
@@ -632,26 +531,14 @@ class TestClearingOldData:
         comments_dir = pr_dir / "comments"
         comments_dir.mkdir(parents=True, exist_ok=True)
         old_file = comments_dir / "old_comment.txt"
-        old_file.write_text("Old comment")
+        old_file.write_bytes(b"Old comment")
         summary_file = pr_dir / "comments_summary.txt"
         summary_file.write_text("OLD_UNIQUE_CONTENT_MARKER")
 
         # Properly mock _get_repo_info and _run_gh_command for a successful empty fetch
         mock_github_client._get_repo_info.return_value = "owner/repo"
-        rest_result = MagicMock()
-        rest_result.stdout = ""  # empty NDJSON → no comments
-        graphql_result = MagicMock()
-        graphql_result.stdout = json.dumps(
-            {
-                "data": {
-                    "repository": {
-                        "pullRequest": {
-                            "reviewThreads": {"pageInfo": {"hasNextPage": False}, "nodes": []}
-                        }
-                    }
-                }
-            }
-        )
+        rest_result = SimpleNamespace(stdout="")  # empty NDJSON → no comments
+        graphql_result = SimpleNamespace(stdout=_EMPTY_THREADS_STDOUT)
         mock_github_client._run_gh_command.side_effect = [rest_result, graphql_result]
 
         pr_context.save_pr_comments(123, _also_save_ci=False)
@@ -673,7 +560,7 @@ class TestClearingOldData:
         comments_dir = pr_dir / "comments"
         comments_dir.mkdir(parents=True, exist_ok=True)
         old_file = comments_dir / "old_comment.txt"
-        old_file.write_text("Old comment")
+        old_file.write_bytes(b"Old comment")
 
         mock_github_client._get_repo_info.side_effect = Exception("API unavailable")
 
@@ -687,40 +574,39 @@ class TestErrorHandling:
     """Tests for error handling in combined CI + comments scenarios."""
 
     def test_save_ci_failures_handles_comment_errors(
-        self, pr_context: PRContextManager, state_manager: StateManager
+        self, pr_context: PRContextManager, state_manager: StateManager, mock_run: MagicMock
     ) -> None:
         """Test that CI failures are saved even if comment saving fails."""
-        with patch("subprocess.run") as mock_run:
-            # Make comment fetching fail
-            mock_run.side_effect = Exception("Network error")
+        # Make comment fetching fail
+        mock_run.side_effect = Exception("Network error")
 
-            # Should not raise - should handle error gracefully
-            pr_context.save_ci_failures(123)
+        # Should not raise - should handle error gracefully
+        pr_context.save_ci_failures(123)
 
     def test_save_pr_comments_handles_ci_errors(
         self,
         pr_context: PRContextManager,
         state_manager: StateManager,
         mock_github_client: MagicMock,
+        mock_run: MagicMock,
     ) -> None:
         """Test that comments are saved even if CI saving fails."""
         # Make CI fetching fail
         mock_github_client.get_failed_run_logs.side_effect = Exception("API error")
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = [
-                MagicMock(returncode=0, stdout="owner/repo\n"),
-                MagicMock(
-                    returncode=0,
-                    stdout='{"data": {"repository": {"pullRequest": {"reviewThreads": {"nodes": []}}}}}',
-                ),
-            ]
+        mock_run.side_effect = [
+            SimpleNamespace(returncode=0, stdout="owner/repo\n"),
+            SimpleNamespace(
+                returncode=0,
+                stdout=_EMPTY_THREADS_STDOUT,
+            ),
+        ]
 
-            # Should not raise - should handle error gracefully
-            count = pr_context.save_pr_comments(123)
+        # Should not raise - should handle error gracefully
+        count = pr_context.save_pr_comments(123)
 
-            # Should return 0 comments (no threads in mock response)
-            assert count == 0
+        # Should return 0 comments (no threads in mock response)
+        assert count == 0
 
     def test_get_combined_feedback_handles_missing_pr_dir(
         self, pr_context: PRContextManager
@@ -733,6 +619,22 @@ class TestErrorHandling:
         assert has_ci is False
         assert has_comments is False
 
+    @pytest.mark.parametrize("method", ["has_pr_comments", "has_ci_failures"])
+    def test_feedback_check_handles_exception(
+        self, pr_context: PRContextManager, state_manager: StateManager, method: str
+    ) -> None:
+        """Test the feedback checks report False when the PR dir lookup raises."""
+        with patch.object(state_manager, "_pr_dir_path", side_effect=Exception("Error")):
+            assert getattr(pr_context, method)(123) is False
+
+    @pytest.mark.parametrize("method", ["has_pr_comments", "has_ci_failures"])
+    def test_feedback_check_does_not_create_pr_dir(
+        self, pr_context: PRContextManager, state_manager: StateManager, method: str
+    ) -> None:
+        """Test the feedback checks leave an unseen PR's directory uncreated."""
+        assert getattr(pr_context, method)(999) is False
+        assert not state_manager._pr_dir_path(999).exists()
+
 
 class TestIntegrationScenarios:
     """Integration tests for realistic CI + comments scenarios."""
@@ -742,13 +644,14 @@ class TestIntegrationScenarios:
         pr_context: PRContextManager,
         state_manager: StateManager,
         mock_github_client: MagicMock,
+        mock_run: MagicMock,
     ) -> None:
         """Test realistic scenario: CI fails, CodeRabbit has left comments."""
         # Simulate a PR where:
         # 1. Tests are failing
         # 2. CodeRabbit has left actionable comments
 
-        mock_github_client.get_pr_status.return_value = MagicMock(
+        mock_github_client.get_pr_status.return_value = SimpleNamespace(
             check_details=[
                 {
                     "name": "test",
@@ -760,69 +663,68 @@ class TestIntegrationScenarios:
 
         # Repo info + comments go through github_client; CILogDownloader uses subprocess directly.
         mock_github_client._get_repo_info.return_value = "owner/repo"
-        rest_result = MagicMock()
-        # NDJSON: one comment object per line (matches --paginate --jq '.[]')
-        rest_result.stdout = json.dumps(
-            {
-                "id": 123456,
-                "user": {"login": "coderabbitai"},
-                "body": "Consider using a constant for this magic number",
-                "path": "src/main.py",
-                "line": 42,
-            }
+        rest_result = SimpleNamespace(
+            # NDJSON: one comment object per line (matches --paginate --jq '.[]')
+            stdout=json.dumps(
+                {
+                    "id": 123456,
+                    "user": {"login": "coderabbitai"},
+                    "body": "Consider using a constant for this magic number",
+                    "path": "src/main.py",
+                    "line": 42,
+                }
+            )
         )
-        graphql_result = MagicMock()
-        graphql_result.stdout = json.dumps(
-            {
-                "data": {
-                    "repository": {
-                        "pullRequest": {
-                            "reviewThreads": {
-                                "pageInfo": {"hasNextPage": False},
-                                "nodes": [
-                                    {
-                                        "id": "thread_123",
-                                        "isResolved": False,
-                                        "comments": {"nodes": [{"databaseId": 123456}]},
-                                    }
-                                ],
+        graphql_result = SimpleNamespace(
+            stdout=json.dumps(
+                {
+                    "data": {
+                        "repository": {
+                            "pullRequest": {
+                                "reviewThreads": {
+                                    "pageInfo": {"hasNextPage": False},
+                                    "nodes": [
+                                        {
+                                            "id": "thread_123",
+                                            "isResolved": False,
+                                            "comments": {"nodes": [{"databaseId": 123456}]},
+                                        }
+                                    ],
+                                }
                             }
                         }
                     }
                 }
-            }
+            )
         )
         mock_github_client._run_gh_command.side_effect = [rest_result, graphql_result]
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = [
-                # CILogDownloader -> gh api --paginate --jq '.jobs[]' (NDJSON: one job per line)
-                MagicMock(
-                    returncode=0,
-                    stdout=json.dumps(
-                        {"id": 1, "name": "test", "status": "completed", "conclusion": "failure"}
-                    ),
-                    stderr="",
-                ),
-                # CILogDownloader -> gh api .../jobs/1/logs
-                MagicMock(
-                    returncode=0,
-                    stdout=b"FAILED tests/test_main.py::test_addition\nE       AssertionError: 1 + 1 != 3\n",
-                    stderr=b"",
-                ),
-            ]
-
-            # Save CI failures (should also save comments)
-            pr_context.save_ci_failures(123)
-
-            # Verify both exist
-            assert pr_context.has_ci_failures(123) is True
-            assert pr_context.has_pr_comments(123) is True
+        mock_run.side_effect = [
+            # CILogDownloader -> gh api --paginate --jq '.jobs[]' (NDJSON: one job per line)
+            SimpleNamespace(
+                returncode=0,
+                stdout=_FAILED_JOB_STDOUT,
+                stderr="",
+            ),
+            # CILogDownloader -> gh api .../jobs/1/logs
+            SimpleNamespace(
+                returncode=0,
+                stdout=b"FAILED tests/test_main.py::test_addition\nE       AssertionError: 1 + 1 != 3\n",
+                stderr=b"",
+            ),
+        ]
+
+        # Save CI failures (should also save comments)
+        pr_context.save_ci_failures(123)
+
+        # Verify both exist
+        assert pr_context.has_ci_failures(123) is True
+        assert pr_context.has_pr_comments(123) is True
 
-            # Verify get_combined_feedback returns both
-            has_ci, has_comments, pr_dir_path = pr_context.get_combined_feedback(123)
-            assert has_ci is True
-            assert has_comments is True
+        # Verify get_combined_feedback returns both
+        has_ci, has_comments, pr_dir_path = pr_context.get_combined_feedback(123)
+        assert has_ci is True
+        assert has_comments is True
 
     def test_ci_passes_but_comments_exist(
         self,
@@ -836,37 +738,39 @@ class TestIntegrationScenarios:
 
         # All gh calls go through github_client (no subprocess for comments path)
         mock_github_client._get_repo_info.return_value = "owner/repo"
-        rest_result = MagicMock()
-        # NDJSON: one comment object per line (matches --paginate --jq '.[]')
-        rest_result.stdout = json.dumps(
-            {
-                "id": 789012,
-                "user": {"login": "reviewer"},
-                "body": "Please add error handling here",
-                "path": "src/handler.py",
-                "line": 100,
-            }
+        rest_result = SimpleNamespace(
+            # NDJSON: one comment object per line (matches --paginate --jq '.[]')
+            stdout=json.dumps(
+                {
+                    "id": 789012,
+                    "user": {"login": "reviewer"},
+                    "body": "Please add error handling here",
+                    "path": "src/handler.py",
+                    "line": 100,
+                }
+            )
         )
-        graphql_result = MagicMock()
-        graphql_result.stdout = json.dumps(
-            {
-                "data": {
-                    "repository": {
-                        "pullRequest": {
-                            "reviewThreads": {
-                                "pageInfo": {"hasNextPage": False},
-                                "nodes": [
-                                    {
-                                        "id": "thread_456",
-                                        "isResolved": False,
-                                        "comments": {"nodes": [{"databaseId": 789012}]},
-                                    }
-                                ],
+        graphql_result = SimpleNamespace(
+            stdout=json.dumps(
+                {
+                    "data": {
+                        "repository": {
+                            "pullRequest": {
+                                "reviewThreads": {
+                                    "pageInfo": {"hasNextPage": False},
+                                    "nodes": [
+                                        {
+                                            "id": "thread_456",
+                                            "isResolved": False,
+                                            "comments": {"nodes": [{"databaseId": 789012}]},
+                                        }
+                                    ],
+                                }
                             }
                         }
                     }
                 }
-            }
+            )
         )
         mock_github_client._run_gh_command.side_effect = [rest_result, graphql_result]
 
@@ -28,6 +28,7 @@ from claude_task_master.core.config import (
     generate_default_config_json,
     get_model_name,
     get_tools_for_phase,
+    load_config_json,
 )
 from claude_task_master.core.config_loader import (
     CONFIG_FILE_NAME,
@@ -150,10 +151,10 @@ class TestToolsConfig:
     def test_default_values(self) -> None:
         """Test that ToolsConfig defaults to restricted read-only planning/verification."""
         config = ToolsConfig()
-        assert config.planning == ["Read", "Glob", "Grep", "WebFetch", "WebSearch"]
-        assert config.verification == ["Read", "Glob", "Grep", "Bash"]
+        assert config.planning == ("Read", "Glob", "Grep", "WebFetch", "WebSearch")
+        assert config.verification == ("Read", "Glob", "Grep", "Bash")
         # Working keeps empty default = all tools allowed for implementation.
-        assert config.working == []
+        assert config.working == ()
 
     def test_planning_default_excludes_mutation_tools(self) -> None:
         """Test that planning default cannot write, edit, or run Bash by default."""
@@ -161,23 +162,24 @@ class TestToolsConfig:
         for forbidden in ("Write", "Edit", "MultiEdit", "Bash", "NotebookEdit"):
             assert forbidden not in config.planning
 
-    def test_defaults_are_independent_instances(self) -> None:
-        """Test that mutable list defaults are not shared across instances."""
+    def test_defaults_are_shared_immutable_tuples(self) -> None:
+        """Test that instances share the immutable default tuples instead of copying lists."""
         first = ToolsConfig()
         second = ToolsConfig()
-        first.planning.append("Bash")
-        assert "Bash" not in second.planning
+        assert isinstance(first.planning, tuple)
+        assert first.planning is second.planning
+        assert first.verification is second.verification
 
     def test_custom_tools(self) -> None:
         """Test that ToolsConfig accepts custom tool lists."""
         config = ToolsConfig(
-            planning=["Read", "Glob"],
-            verification=["Bash"],
-            working=["Write", "Edit"],
+            planning=("Read", "Glob"),
+            verification=("Bash",),
+            working=("Write", "Edit"),
         )
-        assert config.planning == ["Read", "Glob"]
-        assert config.verification == ["Bash"]
-        assert config.working == ["Write", "Edit"]
+        assert config.planning == ("Read", "Glob")
+        assert config.verification == ("Bash",)
+        assert config.working == ("Write", "Edit")
 
 
 class TestClaudeTaskMasterConfig:
@@ -198,7 +200,7 @@ class TestClaudeTaskMasterConfig:
         assert config.api.anthropic_api_key is None
         assert config.models.sonnet == "claude-sonnet-5"
         assert config.git.target_branch == "main"
-        assert config.tools.planning == ["Read", "Glob", "Grep", "WebFetch", "WebSearch"]
+        assert config.tools.planning == ("Read", "Glob", "Grep", "WebFetch", "WebSearch")
 
     def test_full_custom_config(self) -> None:
         """Test creating a fully custom configuration."""
@@ -207,13 +209,13 @@ class TestClaudeTaskMasterConfig:
             api=APIConfig(anthropic_api_key="test-key"),
             models=ModelConfig(sonnet="custom-sonnet"),
             git=GitConfig(target_branch="develop"),
-            tools=ToolsConfig(planning=["Read"]),
+            tools=ToolsConfig(planning=("Read",)),
         )
         assert config.version == "1.1"
         assert config.api.anthropic_api_key == "test-key"
         assert config.models.sonnet == "custom-sonnet"
         assert config.git.target_branch == "develop"
-        assert config.tools.planning == ["Read"]
+        assert config.tools.planning == ("Read",)
 
     def test_serialization_to_dict(self) -> None:
         """Test that config serializes to dict correctly."""
@@ -247,7 +249,26 @@ class TestClaudeTaskMasterConfig:
         assert config.api.anthropic_api_key == "test-key"
         assert config.models.sonnet == "custom-sonnet"
         assert config.git.target_branch == "develop"
-        assert config.tools.planning == ["Read"]
+        # JSON-style lists are coerced to the tuple field type.
+        assert config.tools.planning == ("Read",)
+
+    def test_load_config_json_matches_dict_path(self) -> None:
+        """Test that load_config_json validates to the same config as the dict path."""
+        data = {
+            "version": "1.0",
+            "api": {"anthropic_api_key": "test-key"},
+            "models": {"sonnet": "custom-sonnet"},
+            "git": {"target_branch": "develop"},
+            "tools": {"planning": ["Read"]},
+        }
+        expected = ClaudeTaskMasterConfig.model_validate(data)
+        assert load_config_json(json.dumps(data)) == expected
+        assert load_config_json(json.dumps(data).encode()) == expected
+
+    def test_load_config_json_invalid_json(self) -> None:
+        """Test that malformed JSON raises json.JSONDecodeError, not ValidationError."""
+        with pytest.raises(json.JSONDecodeError):
+            load_config_json("{ invalid json }")
 
     def test_partial_config_uses_defaults(self) -> None:
         """Test that partial config uses defaults for missing fields."""
@@ -273,6 +294,14 @@ class TestClaudeTaskMasterConfig:
         with pytest.raises(ValidationError):
             ClaudeTaskMasterConfig(version={"invalid": "type"})  # type: ignore[arg-type]
 
+    def test_config_is_frozen(self) -> None:
+        """Test that loaded config, including nested sections, rejects assignment."""
+        config = ClaudeTaskMasterConfig()
+        with pytest.raises(ValidationError):
+            config.version = "2.0"
+        with pytest.raises(ValidationError):
+            config.git.target_branch = "develop"
+
 
 class TestDefaultConfigGeneration:
     """Tests for default config generation functions."""
@@ -307,83 +336,84 @@ class TestDefaultConfigGeneration:
         data = json.loads(json_str)
         assert data["version"] == "1.0"
 
+    def test_generate_default_config_json_is_cached(self) -> None:
+        """Test the JSON rendering is computed once per indent and matches the defaults."""
+        json_str = generate_default_config_json()
+        assert generate_default_config_json() is json_str
+        assert json.loads(json_str) == generate_default_config_dict()
 
-class TestUtilityFunctions:
-    """Tests for config utility functions."""
-
-    def test_get_model_name_sonnet(self) -> None:
-        """Test get_model_name returns correct model for sonnet."""
-        config = ClaudeTaskMasterConfig()
-        assert get_model_name(config, "sonnet") == "claude-sonnet-5"
-        assert get_model_name(config, "SONNET") == "claude-sonnet-5"
 
-    def test_get_model_name_opus(self) -> None:
-        """Test get_model_name returns correct model for opus."""
-        config = ClaudeTaskMasterConfig()
-        assert get_model_name(config, "opus") == "claude-opus-5"
-        assert get_model_name(config, "OPUS") == "claude-opus-5"
+@pytest.fixture(scope="module")
+def default_config() -> ClaudeTaskMasterConfig:
+    """Provide one default config for the lookup tests; it is frozen, so sharing is safe."""
+    return ClaudeTaskMasterConfig()
 
-    def test_get_model_name_fable(self) -> None:
-        """Test get_model_name returns correct model for fable."""
-        config = ClaudeTaskMasterConfig()
-        assert get_model_name(config, "fable") == "claude-fable-5"
-        assert get_model_name(config, "FABLE") == "claude-fable-5"
 
-    def test_get_model_name_haiku(self) -> None:
-        """Test get_model_name returns correct model for haiku."""
-        config = ClaudeTaskMasterConfig()
-        assert get_model_name(config, "haiku") == "claude-haiku-4-5"
-        assert get_model_name(config, "HAIKU") == "claude-haiku-4-5"
+class TestUtilityFunctions:
+    """Tests for config utility functions."""
 
-    def test_get_model_name_sonnet_1m(self) -> None:
-        """Test get_model_name returns correct model for sonnet_1m."""
-        config = ClaudeTaskMasterConfig()
-        assert get_model_name(config, "sonnet_1m") == "claude-sonnet-5"
-        assert get_model_name(config, "SONNET_1M") == "claude-sonnet-5"
+    @pytest.mark.parametrize(
+        ("model_key", "expected"),
+        [
+            ("sonnet", "claude-sonnet-5"),
+            ("SONNET", "claude-sonnet-5"),
+            ("opus", "claude-opus-5"),
+            ("OPUS", "claude-opus-5"),
+            ("fable", "claude-fable-5"),
+            ("FABLE", "claude-fable-5"),
+            ("haiku", "claude-haiku-4-5"),
+            ("HAIKU", "claude-haiku-4-5"),
+            ("sonnet_1m", "claude-sonnet-5"),
+            ("SONNET_1M", "claude-sonnet-5"),
+            # Unknown keys fall back to sonnet.
+            ("unknown", "claude-sonnet-5"),
+            ("invalid", "claude-sonnet-5"),
+        ],
+    )
+    def test_get_model_name(
+        self, default_config: ClaudeTaskMasterConfig, model_key: str, expected: str
+    ) -> None:
+        """Test get_model_name maps keys case-insensitively, falling back to sonnet."""
+        assert get_model_name(default_config, model_key) == expected
 
     def test_get_model_name_custom_config(self) -> None:
         """Test get_model_name with custom model names."""
         config = ClaudeTaskMasterConfig(models=ModelConfig(sonnet="custom-sonnet-model"))
         assert get_model_name(config, "sonnet") == "custom-sonnet-model"
 
-    def test_get_model_name_unknown_falls_back_to_sonnet(self) -> None:
-        """Test get_model_name falls back to sonnet for unknown keys."""
-        config = ClaudeTaskMasterConfig()
-        assert get_model_name(config, "unknown") == "claude-sonnet-5"
-        assert get_model_name(config, "invalid") == "claude-sonnet-5"
-
-    def test_get_tools_for_phase_planning(self) -> None:
-        """Test get_tools_for_phase returns restricted read-only tools for planning."""
-        config = ClaudeTaskMasterConfig()
-        tools = get_tools_for_phase(config, "planning")
-        assert tools == ["Read", "Glob", "Grep", "WebFetch", "WebSearch"]
-        assert get_tools_for_phase(config, "PLANNING") == tools
-
-    def test_get_tools_for_phase_verification(self) -> None:
-        """Test get_tools_for_phase returns read + Bash tools for verification."""
-        config = ClaudeTaskMasterConfig()
-        tools = get_tools_for_phase(config, "verification")
-        assert tools == ["Read", "Glob", "Grep", "Bash"]
-
-    def test_get_tools_for_phase_working(self) -> None:
-        """Test get_tools_for_phase returns empty list for working."""
-        config = ClaudeTaskMasterConfig()
-        tools = get_tools_for_phase(config, "working")
-        assert tools == []  # Empty means all tools allowed
+    @pytest.mark.parametrize(
+        ("phase", "expected"),
+        [
+            # Planning is restricted to read-only tools.
+            ("planning", ("Read", "Glob", "Grep", "WebFetch", "WebSearch")),
+            ("PLANNING", ("Read", "Glob", "Grep", "WebFetch", "WebSearch")),
+            ("verification", ("Read", "Glob", "Grep", "Bash")),
+            # Empty means all tools allowed.
+            ("working", ()),
+            ("unknown", ()),
+            ("invalid", ()),
+        ],
+    )
+    def test_get_tools_for_phase(
+        self, default_config: ClaudeTaskMasterConfig, phase: str, expected: tuple[str, ...]
+    ) -> None:
+        """Test get_tools_for_phase per phase, with an empty tuple for unknown phases."""
+        assert get_tools_for_phase(default_config, phase) == expected
 
     def test_get_tools_for_phase_custom_config(self) -> None:
         """Test get_tools_for_phase with custom tool configuration."""
         config = ClaudeTaskMasterConfig(
-            tools=ToolsConfig(planning=["Read", "Glob"], working=["Write"])
+            tools=ToolsConfig(planning=("Read", "Glob"), working=("Write",))
         )
-        assert get_tools_for_phase(config, "planning") == ["Read", "Glob"]
-        assert get_tools_for_phase(config, "working") == ["Write"]
-
-    def test_get_tools_for_phase_unknown_returns_empty(self) -> None:
-        """Test get_tools_for_phase returns empty list for unknown phases."""
-        config = ClaudeTaskMasterConfig()
-        assert get_tools_for_phase(config, "unknown") == []
-        assert get_tools_for_phase(config, "invalid") == []
+        assert get_tools_for_phase(config, "planning") == ("Read", "Glob")
+        assert get_tools_for_phase(config, "working") == ("Write",)
+
+    def test_lookups_ignore_non_field_attributes(
+        self, default_config: ClaudeTaskMasterConfig
+    ) -> None:
+        """Test model attributes that are not config fields are treated as unknown keys."""
+        assert get_model_name(default_config, "model_config") == "claude-sonnet-5"
+        assert get_tools_for_phase(default_config, "model_fields") == ()
 
 
 # =============================================================================
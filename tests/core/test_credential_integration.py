@@ -5,8 +5,8 @@ handling, including special characters, unicode, and exception hierarchy.
 """
 
 import json
+from collections.abc import Callable
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
@@ -23,6 +23,44 @@ from claude_task_master.core.credentials import (
     TokenRefreshHTTPError,
 )
 
+# Edge-case credential files, serialized once at import rather than in each test.
+_SPECIAL_TOKEN = "token+with/special=chars&more%stuff"
+_UNICODE_TOKEN = "token_with_unicode_\U0001f510_emoji"
+_EMPTY_STRINGS_JSON = json.dumps(
+    {"claudeAiOauth": {"accessToken": "", "refreshToken": "", "expiresAt": 1704067200000}}
+)
+_EXTRA_FIELDS_JSON = json.dumps(
+    {
+        "claudeAiOauth": {
+            "accessToken": "test-token",
+            "refreshToken": "test-refresh",
+            "expiresAt": 1704067200000,
+            "tokenType": "Bearer",
+            "extra_field": "should_be_ignored",
+            "another_extra": 12345,
+        }
+    }
+)
+_SPECIAL_CHARS_JSON = json.dumps(
+    {
+        "claudeAiOauth": {
+            "accessToken": _SPECIAL_TOKEN,
+            "refreshToken": "refresh-with-special-!@#$%^&*()",
+            "expiresAt": 1704067200000,
+        }
+    }
+)
+_UNICODE_JSON = json.dumps(
+    {
+        "claudeAiOauth": {
+            "accessToken": _UNICODE_TOKEN,
+            "refreshToken": "refresh_token_n",
+            "expiresAt": 1704067200000,
+        }
+    },
+    ensure_ascii=False,
+)
+
 # =============================================================================
 # Integration Tests
 # =============================================================================
@@ -31,21 +69,21 @@ from claude_task_master.core.credentials import (
 class TestCredentialManagerIntegration:
     """Integration tests for the complete workflow."""
 
-    def test_full_workflow_load_and_verify(self, temp_dir, mock_credentials_data):
+    def test_full_workflow_load_and_verify(
+        self, monkeypatch, credentials_path, mock_credentials_data
+    ):
         """Test complete workflow: load credentials and verify (no automatic refresh)."""
-        credentials_path = temp_dir / ".claude" / ".credentials.json"
-        credentials_path.parent.mkdir(parents=True, exist_ok=True)
         credentials_path.write_text(json.dumps(mock_credentials_data))
 
         manager = CredentialManager()
 
-        with patch.object(CredentialManager, "CREDENTIALS_PATH", credentials_path):
-            # Get valid token (no longer triggers automatic refresh)
-            token = manager.get_valid_token()
-            assert token == mock_credentials_data["claudeAiOauth"]["accessToken"]
+        monkeypatch.setattr(CredentialManager, "CREDENTIALS_PATH", credentials_path)
+        # Get valid token (no longer triggers automatic refresh)
+        token = manager.get_valid_token()
+        assert token == mock_credentials_data["claudeAiOauth"]["accessToken"]
 
-            # Verify credentials can be loaded
-            assert manager.verify_credentials() is True
+        # Verify credentials can be loaded
+        assert manager.verify_credentials() is True
 
         # Verify credentials file unchanged (no automatic save)
         saved_data = json.loads(credentials_path.read_text())
@@ -58,18 +96,16 @@ class TestCredentialManagerIntegration:
             == mock_credentials_data["claudeAiOauth"]["refreshToken"]
         )
 
-    def test_multiple_load_operations(self, temp_dir, mock_credentials_data):
+    def test_multiple_load_operations(self, monkeypatch, credentials_path, mock_credentials_data):
         """Test that multiple load operations work correctly."""
-        credentials_path = temp_dir / ".claude" / ".credentials.json"
-        credentials_path.parent.mkdir(parents=True, exist_ok=True)
         credentials_path.write_text(json.dumps(mock_credentials_data))
 
         manager = CredentialManager()
 
-        with patch.object(CredentialManager, "CREDENTIALS_PATH", credentials_path):
-            creds1 = manager.load_credentials()
-            creds2 = manager.load_credentials()
-            creds3 = manager.load_credentials()
+        monkeypatch.setattr(CredentialManager, "CREDENTIALS_PATH", credentials_path)
+        creds1 = manager.load_credentials()
+        creds2 = manager.load_credentials()
+        creds3 = manager.load_credentials()
 
         # All should return the same data
         assert creds1.accessToken == creds2.accessToken == creds3.accessToken
@@ -90,94 +126,53 @@ class TestCredentialManagerIntegration:
 class TestCredentialManagerEdgeCases:
     """Tests for edge cases and error handling."""
 
-    def test_credentials_with_empty_strings(self, temp_dir):
+    def test_credentials_with_empty_strings(self, monkeypatch, credentials_path):
         """Test handling credentials with empty string values."""
-        data = {
-            "claudeAiOauth": {
-                "accessToken": "",
-                "refreshToken": "",
-                "expiresAt": 1704067200000,
-            }
-        }
-        credentials_path = temp_dir / ".claude" / ".credentials.json"
-        credentials_path.parent.mkdir(parents=True, exist_ok=True)
-        credentials_path.write_text(json.dumps(data))
+        credentials_path.write_text(_EMPTY_STRINGS_JSON)
 
         manager = CredentialManager()
 
-        with patch.object(CredentialManager, "CREDENTIALS_PATH", credentials_path):
-            creds = manager.load_credentials()
+        monkeypatch.setattr(CredentialManager, "CREDENTIALS_PATH", credentials_path)
+        creds = manager.load_credentials()
 
         # Empty strings should be allowed (Pydantic doesn't validate content)
         assert creds.accessToken == ""
         assert creds.refreshToken == ""
 
-    def test_credentials_with_extra_fields(self, temp_dir):
+    def test_credentials_with_extra_fields(self, monkeypatch, credentials_path):
         """Test loading credentials with extra unrecognized fields."""
-        data = {
-            "claudeAiOauth": {
-                "accessToken": "test-token",
-                "refreshToken": "test-refresh",
-                "expiresAt": 1704067200000,
-                "tokenType": "Bearer",
-                "extra_field": "should_be_ignored",
-                "another_extra": 12345,
-            }
-        }
-        credentials_path = temp_dir / ".claude" / ".credentials.json"
-        credentials_path.parent.mkdir(parents=True, exist_ok=True)
-        credentials_path.write_text(json.dumps(data))
+        credentials_path.write_text(_EXTRA_FIELDS_JSON)
 
         manager = CredentialManager()
 
-        with patch.object(CredentialManager, "CREDENTIALS_PATH", credentials_path):
-            creds = manager.load_credentials()
+        monkeypatch.setattr(CredentialManager, "CREDENTIALS_PATH", credentials_path)
+        creds = manager.load_credentials()
 
         # Extra fields should be ignored
         assert creds.accessToken == "test-token"
         assert not hasattr(creds, "extra_field")
 
-    def test_credentials_with_special_characters_in_token(self, temp_dir):
+    def test_credentials_with_special_characters_in_token(self, monkeypatch, credentials_path):
         """Test credentials with special characters in tokens."""
-        special_token = "token+with/special=chars&more%stuff"
-        data = {
-            "claudeAiOauth": {
-                "accessToken": special_token,
-                "refreshToken": "refresh-with-special-!@#$%^&*()",
-                "expiresAt": 1704067200000,
-            }
-        }
-        credentials_path = temp_dir / ".claude" / ".credentials.json"
-        credentials_path.parent.mkdir(parents=True, exist_ok=True)
-        credentials_path.write_text(json.dumps(data))
+        credentials_path.write_text(_SPECIAL_CHARS_JSON)
 
         manager = CredentialManager()
 
-        with patch.object(CredentialManager, "CREDENTIALS_PATH", credentials_path):
-            creds = manager.load_credentials()
+        monkeypatch.setattr(CredentialManager, "CREDENTIALS_PATH", credentials_path)
+        creds = manager.load_credentials()
 
-        assert creds.accessToken == special_token
+        assert creds.accessToken == _SPECIAL_TOKEN
 
-    def test_credentials_with_unicode_characters(self, temp_dir):
+    def test_credentials_with_unicode_characters(self, monkeypatch, credentials_path):
         """Test credentials with unicode characters."""
-        unicode_token = "token_with_unicode_\U0001f510_emoji"
-        data = {
-            "claudeAiOauth": {
-                "accessToken": unicode_token,
-                "refreshToken": "refresh_token_n",
-                "expiresAt": 1704067200000,
-            }
-        }
-        credentials_path = temp_dir / ".claude" / ".credentials.json"
-        credentials_path.parent.mkdir(parents=True, exist_ok=True)
-        credentials_path.write_text(json.dumps(data, ensure_ascii=False))
+        credentials_path.write_text(_UNICODE_JSON)
 
         manager = CredentialManager()
 
-        with patch.object(CredentialManager, "CREDENTIALS_PATH", credentials_path):
-            creds = manager.load_credentials()
+        monkeypatch.setattr(CredentialManager, "CREDENTIALS_PATH", credentials_path)
+        creds = manager.load_credentials()
 
-        assert creds.accessToken == unicode_token
+        assert creds.accessToken == _UNICODE_TOKEN
 
 
 # =============================================================================
@@ -185,40 +180,56 @@ class TestCredentialManagerEdgeCases:
 # =============================================================================
 
 
+# Direct CredentialError subclasses, and the errors raised for a failed token refresh.
+_BASE_ERRORS = (
+    CredentialNotFoundError,
+    InvalidCredentialsError,
+    CredentialPermissionError,
+    TokenRefreshError,
+)
+_REFRESH_ERRORS = (
+    NetworkTimeoutError,
+    NetworkConnectionError,
+    TokenRefreshHTTPError,
+    InvalidTokenResponseError,
+)
+
+
 class TestCredentialExceptionHierarchy:
     """Tests for exception class hierarchy."""
 
     def test_exception_hierarchy(self):
         """Test that all custom exceptions inherit correctly."""
-        # All should inherit from CredentialError
-        assert issubclass(CredentialNotFoundError, CredentialError)
-        assert issubclass(InvalidCredentialsError, CredentialError)
-        assert issubclass(CredentialPermissionError, CredentialError)
-        assert issubclass(TokenRefreshError, CredentialError)
-
-        # Token refresh specific errors should inherit from TokenRefreshError
-        assert issubclass(NetworkTimeoutError, TokenRefreshError)
-        assert issubclass(NetworkConnectionError, TokenRefreshError)
-        assert issubclass(TokenRefreshHTTPError, TokenRefreshError)
-        assert issubclass(InvalidTokenResponseError, TokenRefreshError)
-
-    def test_can_catch_all_credential_errors(self):
-        """Test that all credential errors can be caught with base class."""
-        errors = [
-            CredentialNotFoundError(Path("/test")),
-            InvalidCredentialsError("Invalid"),
-            CredentialPermissionError(Path("/test"), "reading", Exception()),
-            TokenRefreshError("Refresh failed"),
-            NetworkTimeoutError("http://test", 30.0),
-            NetworkConnectionError("http://test", Exception()),
-            TokenRefreshHTTPError(401),
-            InvalidTokenResponseError("Invalid response"),
-        ]
-
-        for error in errors:
-            try:
-                raise error
-            except CredentialError:
-                pass  # Expected - all should be caught
-            except Exception as e:
-                pytest.fail(f"Error {type(error).__name__} was not caught as CredentialError: {e}")
+        # Listing the offenders gives a failure that names the misplaced class.
+        assert [
+            c for c in _BASE_ERRORS + _REFRESH_ERRORS if not issubclass(c, CredentialError)
+        ] == []
+        assert [c for c in _REFRESH_ERRORS if not issubclass(c, TokenRefreshError)] == []
+
+    @pytest.mark.parametrize(
+        "make_error",
+        [
+            lambda: CredentialNotFoundError(Path("/test")),
+            lambda: InvalidCredentialsError("Invalid"),
+            lambda: CredentialPermissionError(Path("/test"), "reading", Exception()),
+            lambda: TokenRefreshError("Refresh failed"),
+            lambda: NetworkTimeoutError("http://test", 30.0),
+            lambda: NetworkConnectionError("http://test", Exception()),
+            lambda: TokenRefreshHTTPError(401),
+            lambda: InvalidTokenResponseError("Invalid response"),
+        ],
+        ids=[
+            "not_found",
+            "invalid",
+            "permission",
+            "refresh",
+            "timeout",
+            "connection",
+            "http",
+            "invalid_response",
+        ],
+    )
+    def test_can_catch_all_credential_errors(self, make_error: Callable[[], Exception]):
+        """Test that every credential error can be caught with the base class."""
+        with pytest.raises(CredentialError):
+            raise make_error()
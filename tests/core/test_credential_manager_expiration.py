@@ -4,10 +4,30 @@ This module tests the is_expired method for determining if credentials
 have expired.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, tzinfo
 
+import pytest
+
+from claude_task_master.core import credentials
 from claude_task_master.core.credentials import CredentialManager, Credentials
 
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() is pinned, so expiry cases don't race the clock."""
+
+    @classmethod
+    def now(cls, tz: tzinfo | None = None) -> "_FrozenDatetime":
+        return cls(2025, 1, 15, 12, 0, 0, tzinfo=tz)
+
+
+_NOW = _FrozenDatetime.now()
+
+
+def _ms_from_now(offset: timedelta) -> int:
+    """Millisecond expiresAt timestamp at ``offset`` from the frozen now."""
+    return int((_NOW + offset).timestamp() * 1000)
+
+
 # =============================================================================
 # CredentialManager - Expiration Tests
 # =============================================================================
@@ -16,110 +36,38 @@ from claude_task_master.core.credentials import CredentialManager, Credentials
 class TestCredentialManagerExpiration:
     """Tests for token expiration checking."""
 
-    def test_is_expired_with_future_timestamp(self):
-        """Test that future timestamp is not expired."""
-        manager = CredentialManager()
-        # Set expiration to 1 hour from now
-        future_ts = int((datetime.now() + timedelta(hours=1)).timestamp() * 1000)
-        creds = Credentials(
-            accessToken="test",
-            refreshToken="test",
-            expiresAt=future_ts,
-        )
-        assert manager.is_expired(creds) is False
-
-    def test_is_expired_with_past_timestamp(self):
-        """Test that past timestamp is expired."""
-        manager = CredentialManager()
-        # Set expiration to 1 hour ago
-        past_ts = int((datetime.now() - timedelta(hours=1)).timestamp() * 1000)
-        creds = Credentials(
-            accessToken="test",
-            refreshToken="test",
-            expiresAt=past_ts,
-        )
-        assert manager.is_expired(creds) is True
-
-    def test_is_expired_at_exact_expiration_time(self):
-        """Test that exact expiration time is considered expired."""
-        manager = CredentialManager()
-        # Set expiration to right now
-        now_ts = int(datetime.now().timestamp() * 1000)
-        creds = Credentials(
-            accessToken="test",
-            refreshToken="test",
-            expiresAt=now_ts,
-        )
-        # At exact time or later is expired
-        assert manager.is_expired(creds) is True
-
-    def test_is_expired_with_far_future_timestamp(self):
-        """Test with timestamp far in the future."""
-        manager = CredentialManager()
-        # Set expiration to 1 year from now
-        future_ts = int((datetime.now() + timedelta(days=365)).timestamp() * 1000)
-        creds = Credentials(
-            accessToken="test",
-            refreshToken="test",
-            expiresAt=future_ts,
-        )
-        assert manager.is_expired(creds) is False
-
-    def test_is_expired_with_just_expired_timestamp(self):
-        """Test with timestamp that just expired (1 second ago)."""
-        manager = CredentialManager()
-        # Set expiration to 1 second ago
-        past_ts = int((datetime.now() - timedelta(seconds=1)).timestamp() * 1000)
-        creds = Credentials(
-            accessToken="test",
-            refreshToken="test",
-            expiresAt=past_ts,
-        )
-        assert manager.is_expired(creds) is True
-
-    def test_is_expired_handles_millisecond_timestamp(self):
-        """Test that millisecond timestamps are correctly handled."""
-        manager = CredentialManager()
-        # Create timestamp in milliseconds (as stored in credentials)
-        future_ts = int((datetime.now() + timedelta(hours=1)).timestamp() * 1000)
-        creds = Credentials(
-            accessToken="test",
-            refreshToken="test",
-            expiresAt=future_ts,
-        )
-        # Should properly handle the conversion from milliseconds to seconds
-        assert manager.is_expired(creds) is False
-
-    def test_expires_at_zero_timestamp(self):
-        """Test handling of zero timestamp (epoch)."""
-        manager = CredentialManager()
-        creds = Credentials(
-            accessToken="test",
-            refreshToken="test",
-            expiresAt=0,  # Unix epoch
-        )
-        # Zero timestamp is definitely expired
-        assert manager.is_expired(creds) is True
-
-    def test_expires_at_negative_timestamp(self):
-        """Test handling of negative timestamp."""
-        manager = CredentialManager()
-        creds = Credentials(
-            accessToken="test",
-            refreshToken="test",
-            expiresAt=-1000,  # Negative timestamp
-        )
-        # Negative timestamp is definitely expired
-        assert manager.is_expired(creds) is True
-
-    def test_expires_at_very_large_timestamp(self):
-        """Test handling of very large future timestamp."""
-        manager = CredentialManager()
-        # Year 3000 timestamp in milliseconds
-        far_future_ts = int(datetime(3000, 1, 1).timestamp() * 1000)
-        creds = Credentials(
-            accessToken="test",
-            refreshToken="test",
-            expiresAt=far_future_ts,
-        )
-        assert manager.is_expired(creds) is False
+    @pytest.fixture(autouse=True)
+    def frozen_now(self, monkeypatch) -> None:
+        """Pin the clock is_expired compares against."""
+        monkeypatch.setattr(credentials, "datetime", _FrozenDatetime)
+
+    @pytest.mark.parametrize(
+        ("expires_at", "expected"),
+        [
+            (_ms_from_now(timedelta(hours=1)), False),
+            (_ms_from_now(-timedelta(hours=1)), True),
+            # At exact time or later is expired.
+            (_ms_from_now(timedelta(0)), True),
+            (_ms_from_now(timedelta(days=365)), False),
+            (_ms_from_now(-timedelta(seconds=1)), True),
+            (_ms_from_now(timedelta(milliseconds=1)), False),
+            (0, True),  # Unix epoch
+            (-1000, True),
+            (int(datetime(3000, 1, 1).timestamp() * 1000), False),
+        ],
+        ids=[
+            "future",
+            "past",
+            "exact_expiration_time",
+            "far_future",
+            "just_expired",
+            "one_millisecond_left",
+            "epoch",
+            "negative",
+            "year_3000",
+        ],
+    )
+    def test_is_expired(self, expires_at: int, expected: bool):
+        """Test expiry of millisecond timestamps against a frozen current time."""
+        creds = Credentials(accessToken="test", refreshToken="test", expiresAt=expires_at)
+        assert CredentialManager().is_expired(creds) is expected
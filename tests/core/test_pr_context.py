@@ -20,6 +20,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from claude_task_master.core.pr_context import PRContextManager
+from claude_task_master.core.pr_context_types import _discard_dir
 from claude_task_master.core.state import StateManager
 from claude_task_master.github.exceptions import GitHubError
 
@@ -1459,6 +1460,55 @@ class TestResolveThread:
 # =============================================================================
 
 
+class TestGetResolvedStatusMap:
+    """Tests for _get_resolved_status_map review-thread pagination."""
+
+    @staticmethod
+    def _page(
+        resolved_map: dict[int, tuple[bool, str]], end_cursor: str | None = None
+    ) -> MagicMock:
+        """Build one gh result page; a non-None ``end_cursor`` means more pages follow."""
+        response = make_resolved_status_response(resolved_map)
+        response["data"]["repository"]["pullRequest"]["reviewThreads"]["pageInfo"] = {
+            "hasNextPage": end_cursor is not None,
+            "endCursor": end_cursor,
+        }
+        return MagicMock(stdout=json.dumps(response))
+
+    def test_single_page_issues_one_query(
+        self, pr_context_manager: PRContextManager, mock_github_client: MagicMock
+    ) -> None:
+        """Test that no follow-up query is sent when hasNextPage is false."""
+        mock_github_client._run_gh_command.return_value = self._page({1: (True, "thread_1")})
+
+        result = pr_context_manager._get_resolved_status_map("owner/repo", 123)
+
+        assert result == {1: True}
+        mock_github_client._run_gh_command.assert_called_once()
+        cmd = mock_github_client._run_gh_command.call_args.args[0]
+        assert "reviewThreads(first: 100, after: $cursor)" in cmd[4]
+        assert not any(arg.startswith("cursor=") for arg in cmd)
+
+    def test_follows_cursor_across_pages(
+        self, pr_context_manager: PRContextManager, mock_github_client: MagicMock
+    ) -> None:
+        """Test that pages are merged and the follow-up query carries endCursor."""
+        mock_github_client._run_gh_command.side_effect = [
+            self._page({1: (True, "thread_1"), 2: (False, "thread_2")}, end_cursor="c1"),
+            self._page({3: (False, "thread_3")}),
+        ]
+
+        result = pr_context_manager._get_resolved_status_map("owner/repo", 123)
+
+        assert result == {1: True, 2: False, 3: False}
+        assert pr_context_manager._thread_info[3] == (False, "thread_3")
+        first_cmd, second_cmd = (
+            call.args[0] for call in mock_github_client._run_gh_command.call_args_list
+        )
+        assert not any(arg.startswith("cursor=") for arg in first_cmd)
+        assert second_cmd[-2:] == ["-f", "cursor=c1"]
+
+
 class TestGetResolvedThreadIds:
     """Tests for _get_resolved_thread_ids method."""
 
@@ -1511,6 +1561,59 @@ class TestGetResolvedThreadIds:
         assert result == set()
 
 
+# =============================================================================
+# _discard_dir Tests
+# =============================================================================
+
+
+class TestDiscardDir:
+    """Tests for the rename-then-delete directory clearing helper."""
+
+    def test_directory_disappears_and_tomb_is_deleted(self, tmp_path: Path) -> None:
+        """Test that the directory is gone at once and its contents are deleted later."""
+        target = tmp_path / "comments"
+        target.mkdir()
+        for i in range(3):
+            (target / f"{i}.txt").write_bytes(b"old")
+
+        cleanup = _discard_dir(target)
+
+        assert not target.exists()
+        assert cleanup is not None
+        cleanup.join()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_deletes_tombs_left_by_earlier_runs(self, tmp_path: Path) -> None:
+        """Test that tombs orphaned by an exited run are removed on the next discard."""
+        leftover = tmp_path / ".comments.old.deadbeef"
+        leftover.mkdir()
+        (leftover / "0.txt").write_bytes(b"stale")
+        unrelated = tmp_path / ".ci.old.deadbeef"
+        unrelated.mkdir()
+        target = tmp_path / "comments"
+        target.mkdir()
+
+        cleanup = _discard_dir(target)
+
+        assert not leftover.exists()
+        assert unrelated.exists()
+        assert cleanup is not None
+        cleanup.join()
+        assert list(tmp_path.iterdir()) == [unrelated]
+
+    def test_falls_back_to_rmtree_when_rename_fails(self, tmp_path: Path) -> None:
+        """Test that a failed rename still deletes the directory synchronously."""
+        target = tmp_path / "ci"
+        target.mkdir()
+        (target / "1.log").write_bytes(b"old")
+
+        with patch("claude_task_master.core.pr_context_types.os.rename", side_effect=OSError):
+            cleanup = _discard_dir(target)
+
+        assert cleanup is None
+        assert not target.exists()
+
+
 # =============================================================================
 # _is_non_actionable_comment Tests
 # =============================================================================
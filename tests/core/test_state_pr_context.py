@@ -3,6 +3,7 @@
 import shutil
 from collections.abc import Generator
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -120,6 +121,20 @@ class TestPRContextMethods:
         assert "New comment" in content
         assert "Old comment" not in content
 
+    def test_save_pr_comments_does_not_fsync_each_comment(
+        self, state_manager: StateManager
+    ) -> None:
+        """Test that only the summary is written durably, not every comment file."""
+        comments = [{"body": f"Comment {i}", "path": f"f{i}.py", "line": i} for i in range(5)]
+
+        with patch("claude_task_master.core.state_pr.atomic_write_text") as mock_atomic:
+            state_manager.save_pr_comments(123, comments)
+
+        comments_dir = state_manager.get_pr_dir(123) / "comments"
+        assert len(list(comments_dir.glob("*.txt"))) == 5
+        mock_atomic.assert_called_once()
+        assert mock_atomic.call_args.args[0].name == "comments_summary.txt"
+
     def test_load_pr_context_empty_when_no_context(self, state_manager: StateManager) -> None:
         """Test that load_pr_context returns empty string when no context."""
         context = state_manager.load_pr_context(999)
@@ -15,6 +15,7 @@ from __future__ import annotations
 import itertools
 from contextlib import ExitStack
 from datetime import datetime
+from types import MappingProxyType
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -86,16 +87,19 @@ def no_real_sleep():
 # =============================================================================
 
 
+# Canned agent results; stages only read them, so read-only proxies are shared.
+_WORK_SESSION_RESULT = MappingProxyType({"output": "Fixed", "success": True})
+_RELEASE_CHECK_RESULT = MappingProxyType({"output": "RELEASE_CHECK: PASS", "success": True})
+
+
 @pytest.fixture
 def mock_agent():
     """Create a mock agent wrapper."""
     agent = MagicMock()
-    agent.run_work_session = MagicMock(return_value={"output": "Fixed", "success": True})
+    agent.run_work_session = MagicMock(return_value=_WORK_SESSION_RESULT)
     # Release verification runs through run_release_check (verify-only, no PR
     # contract), separate from run_work_session used by work/fix sessions.
-    agent.run_release_check = MagicMock(
-        return_value={"output": "RELEASE_CHECK: PASS", "success": True}
-    )
+    agent.run_release_check = MagicMock(return_value=_RELEASE_CHECK_RESULT)
     return agent
 
 
@@ -140,22 +144,42 @@ def workflow_handler(mock_agent, state_manager, mock_github_client, mock_pr_cont
     )
 
 
+@pytest.fixture(scope="module")
+def workflow_handler_lite():
+    """Create a WorkflowStageHandler whose collaborators are bare mocks.
+
+    For pure helpers such as the task-description builders, which never touch
+    the agent, state, GitHub client or PR context; none of those fixtures run.
+    """
+    return WorkflowStageHandler(
+        agent=MagicMock(),
+        state_manager=MagicMock(),
+        github_client=MagicMock(),
+        pr_context=MagicMock(),
+    )
+
+
+# Fixed state timestamp: only serialized, never compared to wall time.
+_TIMESTAMP = "2025-01-01T00:00:00"
+
+# Validated once at import; basic_task_state hands each test a deep copy.
+_TASK_STATE_TEMPLATE = TaskState(
+    status="working",
+    workflow_stage="working",
+    current_task_index=0,
+    session_count=1,
+    created_at=_TIMESTAMP,
+    updated_at=_TIMESTAMP,
+    run_id="test-run-id",
+    model="sonnet",
+    options=TaskOptions(auto_merge=True, max_sessions=10, pause_on_pr=False),
+)
+
+
 @pytest.fixture
-def basic_task_state(sample_task_options):
+def basic_task_state():
     """Create a basic task state for testing."""
-    now = datetime.now().isoformat()
-    options = TaskOptions(**sample_task_options)
-    return TaskState(
-        status="working",
-        workflow_stage="working",
-        current_task_index=0,
-        session_count=1,
-        created_at=now,
-        updated_at=now,
-        run_id="test-run-id",
-        model="sonnet",
-        options=options,
-    )
+    return _TASK_STATE_TEMPLATE.model_copy(deep=True)
 
 
 @pytest.fixture
@@ -643,12 +667,17 @@ class TestHandleWaitingCIStage:
 class TestHandleCIFailedStage:
     """Tests for handle_ci_failed_stage method."""
 
-    @patch("claude_task_master.core.stages.pr_fix_stage.interruptible_sleep")
-    @patch("claude_task_master.core.stages.pr_fix_stage.console")
+    @pytest.fixture(autouse=True)
+    def _quiet_pr_fix_stage(self, monkeypatch):
+        """Skip the post-fix CI wait and console output for every test here."""
+        monkeypatch.setattr(
+            "claude_task_master.core.stages.pr_fix_stage.interruptible_sleep",
+            lambda *_args, **_kwargs: True,
+        )
+        monkeypatch.setattr("claude_task_master.core.stages.pr_fix_stage.console", MagicMock())
+
     def test_runs_agent_to_fix(
         self,
-        mock_console,
-        mock_sleep,
         workflow_handler,
         state_manager,
         basic_task_state,
@@ -658,7 +687,6 @@ class TestHandleCIFailedStage:
         """Should run agent to fix CI failures."""
         state_manager.state_dir.mkdir(exist_ok=True)
         basic_task_state.current_pr = 42
-        mock_sleep.return_value = True
 
         with (
             patch.object(WorkflowStageHandler, "_get_current_branch", return_value="feature/fix"),
@@ -672,12 +700,8 @@ class TestHandleCIFailedStage:
         assert basic_task_state.workflow_stage == "waiting_ci"
         assert basic_task_state.session_count == 2  # Incremented
 
-    @patch("claude_task_master.core.stages.pr_fix_stage.interruptible_sleep")
-    @patch("claude_task_master.core.stages.pr_fix_stage.console")
     def test_uses_opus_model(
         self,
-        mock_console,
-        mock_sleep,
         workflow_handler,
         state_manager,
         basic_task_state,
@@ -688,7 +712,6 @@ class TestHandleCIFailedStage:
 
         state_manager.state_dir.mkdir(exist_ok=True)
         basic_task_state.current_pr = 42
-        mock_sleep.return_value = True
 
         with patch.object(WorkflowStageHandler, "_get_current_branch", return_value="main"):
             workflow_handler.handle_ci_failed_stage(basic_task_state)
@@ -696,12 +719,8 @@ class TestHandleCIFailedStage:
         call_kwargs = mock_agent.run_work_session.call_args.kwargs
         assert call_kwargs["model_override"] == ModelType.OPUS
 
-    @patch("claude_task_master.core.stages.pr_fix_stage.interruptible_sleep")
-    @patch("claude_task_master.core.stages.pr_fix_stage.console")
     def test_context_load_error_continues(
         self,
-        mock_console,
-        mock_sleep,
         workflow_handler,
         state_manager,
         basic_task_state,
@@ -710,7 +729,6 @@ class TestHandleCIFailedStage:
         """Should continue even if context load fails."""
         state_manager.state_dir.mkdir(exist_ok=True)
         basic_task_state.current_pr = 42
-        mock_sleep.return_value = True
 
         with (
             patch.object(state_manager, "load_context", side_effect=Exception("Error")),
@@ -2408,11 +2426,11 @@ class TestFixSessionPushOnlyMode:
         [(True, True), (True, False), (False, True)],
     )
     def test_ci_comments_task_body_has_no_rebase_mandate(
-        self, workflow_handler, has_ci, has_comments
+        self, workflow_handler_lite, has_ci, has_comments
     ):
         """CI/comment fix bodies must not mandate rebase or force-push — the single
         push_only policy owns the git mechanics (`git push origin HEAD`)."""
-        task = workflow_handler._build_combined_ci_comments_task(
+        task = workflow_handler_lite._build_combined_ci_comments_task(
             42, has_ci, has_comments, "/tmp/pr-42"
         )
         lowered = task.lower()
@@ -197,10 +197,11 @@ class TestCIFailureWithCommentsScenario:
             has_comments=True,
             pr_dir_path=str(pr_dir),
         )
+        task_lower = task_desc.lower()
 
         # Should mention both CI failures and review comments
         assert "CI" in task_desc
-        assert "comment" in task_desc.lower() or "review" in task_desc.lower()
+        assert "comment" in task_lower or "review" in task_lower
         assert "123" in task_desc  # PR number
 
 
@@ -336,9 +337,10 @@ class TestCombinedTaskDescription:
             has_comments=False,
             pr_dir_path=str(pr_dir),
         )
+        task_lower = task_desc.lower()
 
         # Should focus on CI
-        assert "CI" in task_desc or "ci" in task_desc.lower()
+        assert "CI" in task_desc or "ci" in task_lower
         # Should not have comments section as primary focus
         # (may still mention to check for comments)
 
@@ -369,9 +371,10 @@ class TestCombinedTaskDescription:
             has_comments=True,
             pr_dir_path=str(pr_dir),
         )
+        task_lower = task_desc.lower()
 
         # Should focus on review comments
-        assert "comment" in task_desc.lower() or "review" in task_desc.lower()
+        assert "comment" in task_lower or "review" in task_lower
 
     def test_both_ci_and_comments_task_description(
         self,
@@ -400,12 +403,13 @@ class TestCombinedTaskDescription:
             has_comments=True,
             pr_dir_path=str(pr_dir),
         )
+        task_lower = task_desc.lower()
 
         # Should mention both
-        assert "CI" in task_desc or "ci" in task_desc.lower()
-        assert "comment" in task_desc.lower() or "review" in task_desc.lower()
+        assert "CI" in task_desc or "ci" in task_lower
+        assert "comment" in task_lower or "review" in task_lower
         # Should emphasize handling both in one session
-        assert "both" in task_desc.lower() or "BOTH" in task_desc or "single" in task_desc.lower()
+        assert "both" in task_lower or "BOTH" in task_desc or "single" in task_lower
 
 
 class TestCICommentsWorkflowIntegration: